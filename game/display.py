@@ -7,10 +7,49 @@ presentation of the game state and progress to the user.
 
 import os
 import time
-from typing import Dict, Any, List, Optional, Tuple, Union
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple, Union
 import sys
 
 
+# ANSI color codes, shared (read-only) by all Display instances
+ANSI_COLORS = MappingProxyType({
+    'RESET': '\033[0m',
+    'BOLD': '\033[1m',
+    'RED': '\033[91m',
+    'GREEN': '\033[92m',
+    'YELLOW': '\033[93m',
+    'BLUE': '\033[94m',
+    'MAGENTA': '\033[95m',
+    'CYAN': '\033[96m',
+})
+
+# Same keys as ANSI_COLORS, used when colored output is disabled
+NO_COLORS = MappingProxyType(dict.fromkeys(ANSI_COLORS, ''))
+
+
+@lru_cache(maxsize=None)
+def _supports_color() -> bool:
+    """
+    Check if the terminal supports color output.
+    
+    The result is computed once per process and shared by all Display instances.
+    
+    Returns:
+        bool: True if the terminal supports color, False otherwise
+    """
+    # Simple check for color support
+    if os.name == 'nt':  # Windows
+        return 'ANSICON' in os.environ or 'WT_SESSION' in os.environ
+    else:  # macOS, Linux, etc.
+        return sys.stdout.isatty()
+
+
+# Upper bound on the number of memoized colored strings kept per Display
+COLOR_CACHE_SIZE = 512
+
+
 class Display:
     """
     Handles the display and user interaction aspects of the game.
@@ -19,6 +58,9 @@ class Display:
     for the genetic algorithm number guessing game.
     """
     
+    # Column layout shared by the generation table header and its rows
+    ROW_FORMAT = "{:^8} | {:^12} | {:^12} | {:^12}"
+    
     def __init__(self, verbose: bool = True, use_colors: bool = True):
         """
         Initialize the Display object with display preferences.
@@ -28,35 +70,56 @@ class Display:
             use_colors: Whether to use colored output in the terminal
         """
         self.verbose = verbose
-        self.use_colors = use_colors and self._supports_color()
-        
-        # ANSI color codes
-        if self.use_colors:
-            self.COLORS = {
-                'RESET': '\033[0m',
-                'BOLD': '\033[1m',
-                'RED': '\033[91m',
-                'GREEN': '\033[92m',
-                'YELLOW': '\033[93m',
-                'BLUE': '\033[94m',
-                'MAGENTA': '\033[95m',
-                'CYAN': '\033[96m',
-            }
-        else:
-            self.COLORS = {k: '' for k in ['RESET', 'BOLD', 'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN']}
+        
+        # The terminal probe and everything derived from it is deferred to first use
+        self._use_colors_pref = use_colors
+        
+        # Memoized output of _color_text, keyed on (text, color)
+        self._color_cache: Dict[Tuple[str, str], str] = {}
     
-    def _supports_color(self) -> bool:
+    @cached_property
+    def use_colors(self) -> bool:
         """
-        Check if the terminal supports color output.
+        Whether colored output is enabled and supported by the terminal.
         
         Returns:
-            bool: True if the terminal supports color, False otherwise
+            bool: True if colors should be used, False otherwise
         """
-        # Simple check for color support
-        if os.name == 'nt':  # Windows
-            return 'ANSICON' in os.environ or 'WT_SESSION' in os.environ
-        else:  # macOS, Linux, etc.
-            return sys.stdout.isatty()
+        return bool(self._use_colors_pref) and _supports_color()
+    
+    @cached_property
+    def COLORS(self) -> Mapping[str, str]:
+        """
+        ANSI color codes, or empty strings when colors are disabled.
+        
+        Returns:
+            Mapping[str, str]: Mapping of color names to escape sequences
+        """
+        return ANSI_COLORS if self.use_colors else NO_COLORS
+    
+    @cached_property
+    def _reset(self) -> str:
+        """The escape sequence that ends a colored span."""
+        return self.COLORS['RESET']
+    
+    @cached_property
+    def _welcome_header(self) -> str:
+        """The bordered game title shown by show_welcome."""
+        title = "GENETIC ALGORITHM NUMBER GUESSING GAME"
+        border = self._color_text("=" * len(title), 'BOLD')
+        return "\n".join([border, self._color_text(title, 'BOLD'), border])
+    
+    @cached_property
+    def _generation_header(self) -> str:
+        """The column header of the generation progress table."""
+        header = self.ROW_FORMAT.format('Gen #', 'Best Guess', 'Best Fitness', 'Avg Fitness')
+        divider = self._color_text("-" * len(header), 'BOLD')
+        return "\n".join(["", divider, self._color_text(header, 'BOLD'), divider])
+    
+    @cached_property
+    def _results_divider(self) -> str:
+        """The divider framing the final results."""
+        return self._color_text("=" * 50, 'BOLD')
     
     def _color_text(self, text: str, color: str) -> str:
         """
@@ -69,14 +132,35 @@ class Display:
         Returns:
             str: The formatted text
         """
-        if color in self.COLORS:
-            return f"{self.COLORS[color]}{text}{self.COLORS['RESET']}"
-        return text
+        # Without colors there is nothing to wrap, so skip the cache entirely
+        if not self.use_colors:
+            return text
+        
+        key = (text, color)
+        cached = self._color_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        prefix = self.COLORS.get(color)
+        cached = f"{prefix}{text}{self._reset}" if prefix is not None else text
+        
+        # Generation rows are mostly unique, so keep the cache bounded
+        if len(self._color_cache) >= COLOR_CACHE_SIZE:
+            self._color_cache.clear()
+        self._color_cache[key] = cached
+        return cached
     
     def clear_screen(self) -> None:
         """
         Clear the terminal screen.
         """
+        # On ANSI-capable terminals, clear with an escape sequence instead of
+        # spawning a shell to run the clear command
+        if self.use_colors and os.name != 'nt':
+            sys.stdout.write('\033[2J\033[H')
+            sys.stdout.flush()
+            return
+        
         os.system('cls' if os.name == 'nt' else 'clear')
     
     def show_welcome(self) -> None:
@@ -84,26 +168,26 @@ class Display:
         Display the welcome message and game instructions.
         """
         self.clear_screen()
-        title = "GENETIC ALGORITHM NUMBER GUESSING GAME"
-        border = "=" * len(title)
-        
-        print(self._color_text(border, 'BOLD'))
-        print(self._color_text(title, 'BOLD'))
-        print(self._color_text(border, 'BOLD'))
-        print()
-        print("Welcome to the Genetic Algorithm Number Guessing Game!")
-        print()
-        print("In this game, you'll enter a secret number, and the genetic algorithm")
-        print("will attempt to evolve a population of guesses to find your number.")
-        print()
-        print(self._color_text("How it works:", 'BOLD'))
-        print("1. You enter a secret number within a specified range.")
-        print("2. The algorithm creates a population of random guesses.")
-        print("3. Through selection, crossover, and mutation, the algorithm evolves better guesses.")
-        print("4. The process continues until the secret number is found or the maximum number of generations is reached.")
-        print()
-        print(self._color_text("Let's get started!", 'GREEN'))
-        print()
+        lines = [
+            self._welcome_header,
+            "",
+            "Welcome to the Genetic Algorithm Number Guessing Game!",
+            "",
+            "In this game, you'll enter a secret number, and the genetic algorithm",
+            "will attempt to evolve a population of guesses to find your number.",
+            "",
+            self._color_text("How it works:", 'BOLD'),
+            "1. You enter a secret number within a specified range.",
+            "2. The algorithm creates a population of random guesses.",
+            "3. Through selection, crossover, and mutation, the algorithm evolves better guesses.",
+            "4. The process continues until the secret number is found or the maximum number of generations is reached.",
+            "",
+            self._color_text("Let's get started!", 'GREEN'),
+            "",
+        ]
+        
+        # Emit the whole block with a single write
+        print("\n".join(lines))
         
         # Wait for user to press enter
         input("Press Enter to continue...")
@@ -165,30 +249,29 @@ class Display:
         Returns:
             Union[int, float]: The parameter value
         """
-        param_type = type(default)
+        # The prompt, converter and messages don't change between attempts
+        converter = int if type(default) == int else float
+        full_prompt = self._color_text(f"{prompt} ({min_val}-{max_val}, default={default}): ", 'CYAN')
+        range_error = self._color_text(f"Value must be between {min_val} and {max_val}.", 'RED')
+        type_error = self._color_text(f"Please enter a valid {'integer' if converter is int else 'number'}.", 'RED')
         
         while True:
+            user_input = input(full_prompt)
+            
+            # Use default if empty input
+            if not user_input.strip():
+                return default
+            
             try:
-                full_prompt = f"{prompt} ({min_val}-{max_val}, default={default}): "
-                user_input = input(self._color_text(full_prompt, 'CYAN'))
-                
-                # Use default if empty input
-                if not user_input.strip():
-                    return default
-                
-                # Convert to appropriate type
-                if param_type == int:
-                    value = int(user_input)
-                else:
-                    value = float(user_input)
-                
-                # Validate range
-                if min_val <= value <= max_val:
-                    return value
-                else:
-                    print(self._color_text(f"Value must be between {min_val} and {max_val}.", 'RED'))
+                value = converter(user_input)
             except ValueError:
-                print(self._color_text(f"Please enter a valid {'integer' if param_type == int else 'number'}.", 'RED'))
+                print(type_error)
+                continue
+            
+            # Validate range
+            if min_val <= value <= max_val:
+                return value
+            print(range_error)
     
     def show_game_setup(self, secret_number: int, config: Dict[str, Any]) -> None:
         """
@@ -199,26 +282,30 @@ class Display:
             config: Dictionary containing configuration parameters
         """
         self.clear_screen()
-        print(self._color_text("Game Setup Complete!", 'GREEN'))
-        print()
+        lines = [self._color_text("Game Setup Complete!", 'GREEN'), ""]
         
         # Only show the secret number if in verbose mode
         if self.verbose:
-            print(f"Secret Number: {self._color_text(str(secret_number), 'YELLOW')}")
-        
-        print()
-        print(self._color_text("Game Parameters:", 'BOLD'))
-        print(f"- Number Range: {config.get('MIN_NUMBER', 1)}-{config.get('MAX_NUMBER', 100)}")
-        print(f"- Population Size: {config.get('POPULATION_SIZE', 20)}")
-        print(f"- Crossover Rate: {config.get('CROSSOVER_RATE', 0.8)}")
-        print(f"- Mutation Rate: {config.get('MUTATION_RATE', 0.1)}")
-        print(f"- Elitism Count: {config.get('ELITISM_COUNT', 2)}")
-        print(f"- Maximum Generations: {config.get('MAX_GENERATIONS', 1000)}")
-        print()
-        
-        print(self._color_text("The genetic algorithm will now attempt to guess your number...", 'CYAN'))
-        print()
-        time.sleep(2)  # Short pause for readability
+            lines.append(f"Secret Number: {self._color_text(str(secret_number), 'YELLOW')}")
+        
+        lines.extend([
+            "",
+            self._color_text("Game Parameters:", 'BOLD'),
+            f"- Number Range: {config.get('MIN_NUMBER', 1)}-{config.get('MAX_NUMBER', 100)}",
+            f"- Population Size: {config.get('POPULATION_SIZE', 20)}",
+            f"- Crossover Rate: {config.get('CROSSOVER_RATE', 0.8)}",
+            f"- Mutation Rate: {config.get('MUTATION_RATE', 0.1)}",
+            f"- Elitism Count: {config.get('ELITISM_COUNT', 2)}",
+            f"- Maximum Generations: {config.get('MAX_GENERATIONS', 1000)}",
+            "",
+            self._color_text("The genetic algorithm will now attempt to guess your number...", 'CYAN'),
+            "",
+        ])
+        print("\n".join(lines))
+        
+        # Short pause for readability, skipped in quiet or fast mode
+        if self.verbose and not config.get('FAST_MODE', False):
+            time.sleep(config.get('SETUP_PAUSE', 2))
     
     def show_message(self, message: str, color: str = 'RESET') -> None:
         """
@@ -243,13 +330,7 @@ class Display:
         """
         Display the header for generation progress.
         """
-        print()
-        header = f"{'Gen #':^8} | {'Best Guess':^12} | {'Best Fitness':^12} | {'Avg Fitness':^12}"
-        divider = "-" * len(header)
-        
-        print(self._color_text(divider, 'BOLD'))
-        print(self._color_text(header, 'BOLD'))
-        print(self._color_text(divider, 'BOLD'))
+        print(self._generation_header)
     
     def show_generation_progress(self, generation: int, best_guess: Union[int, str], best_fitness: float, avg_fitness: float) -> None:
         """
@@ -261,11 +342,8 @@ class Display:
             best_fitness: The fitness of the best individual
             avg_fitness: The average fitness of the population
         """
-        # Format the best guess
-        if isinstance(best_guess, int):
-            best_guess_str = str(best_guess)
-        else:
-            best_guess_str = best_guess  # Already a string (e.g., '?')
+        # Format the best guess (may already be a string, e.g. '?')
+        best_guess_str = str(best_guess)
         
         # Format the fitness values
         best_fitness_str = f"{best_fitness:.2f}"
@@ -282,7 +360,7 @@ class Display:
             color = 'RESET'
         
         # Format and print the row
-        row = f"{generation:^8} | {best_guess_str:^12} | {best_fitness_str:^12} | {avg_fitness_str:^12}"
+        row = self.ROW_FORMAT.format(generation, best_guess_str, best_fitness_str, avg_fitness_str)
         print(self._color_text(row, color))
     
     def show_max_generations_reached(self, max_generations: int) -> None:
@@ -292,12 +370,15 @@ class Display:
         Args:
             max_generations: The maximum number of generations
         """
-        print()
-        print(self._color_text(f"Maximum number of generations ({max_generations}) reached without finding the solution.", 'YELLOW'))
-        print(self._color_text("The algorithm failed to guess the exact number.", 'YELLOW'))
-        print()
+        print("\n".join([
+            "",
+            self._color_text(f"Maximum number of generations ({max_generations}) reached without finding the solution.", 'YELLOW'),
+            self._color_text("The algorithm failed to guess the exact number.", 'YELLOW'),
+            "",
+        ]))
     
-    def show_game_results(self, secret_number: int, generations: int, elapsed_time: float, history: List[Dict[str, Any]]) -> None:
+    def show_game_results(self, secret_number: int, generations: int, elapsed_time: float, history: Dict[str, Sequence],
+                          best_index: Optional[int] = None) -> None:
         """
         Display the final results of the game.
         
@@ -305,94 +386,102 @@ class Display:
             secret_number: The secret number
             generations: The number of generations
             elapsed_time: The elapsed time in seconds
-            history: The generation history
+            history: The generation history, stored column-wise
+            best_index: Index of the best generation in the history, if already known
         """
-        solution_found = generations > 0 and history and history[-1]['best_fitness'] == 100
+        fitness_history = history['best_fitness']
+        solution_found = generations > 0 and len(fitness_history) > 0 and fitness_history[-1] == 100
         
-        print()
-        print(self._color_text("=" * 50, 'BOLD'))
+        lines = ["", self._results_divider]
         
         if solution_found:
-            print(self._color_text("SOLUTION FOUND!", 'GREEN'))
+            lines.append(self._color_text("SOLUTION FOUND!", 'GREEN'))
         else:
-            print(self._color_text("GAME OVER", 'YELLOW'))
+            lines.append(self._color_text("GAME OVER", 'YELLOW'))
         
-        print(self._color_text("=" * 50, 'BOLD'))
-        print()
+        lines.extend([self._results_divider, ""])
         
-        print(f"Secret Number: {self._color_text(str(secret_number), 'CYAN')}")
+        lines.append(f"Secret Number: {self._color_text(str(secret_number), 'CYAN')}")
         
         if solution_found:
-            print(f"Number found in: {self._color_text(str(generations), 'GREEN')} generations")
-            print(f"Time taken: {self._color_text(f'{elapsed_time:.2f}', 'GREEN')} seconds")
+            lines.append(f"Number found in: {self._color_text(str(generations), 'GREEN')} generations")
+            lines.append(f"Time taken: {self._color_text(f'{elapsed_time:.2f}', 'GREEN')} seconds")
         else:
-            best_gen = max(history, key=lambda x: x['best_fitness']) if history else None
-            best_fitness = best_gen['best_fitness'] if best_gen else 0
-            best_guess = best_gen['best_guess'] if best_gen else '?'
+            if best_index is None and fitness_history:
+                best_index = max(range(len(fitness_history)), key=fitness_history.__getitem__)
+            
+            if best_index is not None:
+                best_fitness = fitness_history[best_index]
+                best_guess = history['best_guess'][best_index]
+            else:
+                best_fitness = 0
+                best_guess = '?'
             
-            print(f"Best guess: {self._color_text(str(best_guess), 'YELLOW')}")
-            print(f"Best fitness: {self._color_text(f'{best_fitness:.2f}', 'YELLOW')}")
-            print(f"Generations run: {self._color_text(str(generations), 'YELLOW')}")
-            print(f"Time taken: {self._color_text(f'{elapsed_time:.2f}', 'YELLOW')} seconds")
+            lines.append(f"Best guess: {self._color_text(str(best_guess), 'YELLOW')}")
+            lines.append(f"Best fitness: {self._color_text(f'{best_fitness:.2f}', 'YELLOW')}")
+            lines.append(f"Generations run: {self._color_text(str(generations), 'YELLOW')}")
+            lines.append(f"Time taken: {self._color_text(f'{elapsed_time:.2f}', 'YELLOW')} seconds")
         
-        print()
+        lines.append("")
+        print("\n".join(lines))
         
         # Display additional statistics if in verbose mode
-        if self.verbose and solution_found and len(history) > 1:
+        if self.verbose and solution_found and len(fitness_history) > 1:
             self._show_performance_statistics(history)
     
-    def _show_performance_statistics(self, history: List[Dict[str, Any]]) -> None:
+    def _show_performance_statistics(self, history: Dict[str, Sequence]) -> None:
         """
         Display performance statistics about the genetic algorithm.
         
         Args:
-            history: The generation history
+            history: The generation history, stored column-wise
         """
-        print(self._color_text("Performance Statistics:", 'BOLD'))
+        lines = [self._color_text("Performance Statistics:", 'BOLD')]
         
         # Calculate improvement metrics
-        first_fitness = history[0]['best_fitness'] if history else 0
-        last_fitness = history[-1]['best_fitness'] if history else 0
+        fitness_history = history['best_fitness']
+        first_fitness = fitness_history[0] if fitness_history else 0
+        last_fitness = fitness_history[-1] if fitness_history else 0
         total_improvement = last_fitness - first_fitness
         
-        # Find the generation with the biggest improvement
+        # Find the biggest improvement and the first generations crossing the
+        # 90/95/99% fitness thresholds in a single pass over the history
         max_improvement = 0
         max_improvement_gen = 0
+        gen_90 = None
+        gen_95 = None
+        gen_99 = None
+        prev_fitness = first_fitness
         
-        for i in range(1, len(history)):
-            improvement = history[i]['best_fitness'] - history[i-1]['best_fitness']
+        for gen, fitness in zip(history['generation'], fitness_history):
+            improvement = fitness - prev_fitness
             if improvement > max_improvement:
                 max_improvement = improvement
-                max_improvement_gen = history[i]['generation']
-        
-        print(f"- Initial best fitness: {first_fitness:.2f}")
-        print(f"- Total fitness improvement: {total_improvement:.2f}")
-        
-        if max_improvement > 0:
-            print(f"- Biggest improvement: {max_improvement:.2f} at generation {max_improvement_gen}")
-        
-        # Calculate convergence metrics if solution was found
-        if last_fitness == 100:
-            gen_90 = None
-            gen_95 = None
-            gen_99 = None
+                max_improvement_gen = gen
+            prev_fitness = fitness
             
-            for entry in history:
-                fitness = entry['best_fitness']
-                gen = entry['generation']
-                
-                if fitness >= 90 and gen_90 is None:
+            if gen_99 is None and fitness >= 90:
+                if gen_90 is None:
                     gen_90 = gen
                 if fitness >= 95 and gen_95 is None:
                     gen_95 = gen
-                if fitness >= 99 and gen_99 is None:
+                if fitness >= 99:
                     gen_99 = gen
-            
+        
+        lines.append(f"- Initial best fitness: {first_fitness:.2f}")
+        lines.append(f"- Total fitness improvement: {total_improvement:.2f}")
+        
+        if max_improvement > 0:
+            lines.append(f"- Biggest improvement: {max_improvement:.2f} at generation {max_improvement_gen}")
+        
+        # Report convergence metrics if solution was found
+        if last_fitness == 100:
             if gen_90:
-                print(f"- Reached 90% fitness at generation: {gen_90}")
+                lines.append(f"- Reached 90% fitness at generation: {gen_90}")
             if gen_95:
-                print(f"- Reached 95% fitness at generation: {gen_95}")
+                lines.append(f"- Reached 95% fitness at generation: {gen_95}")
             if gen_99:
-                print(f"- Reached 99% fitness at generation: {gen_99}")
+                lines.append(f"- Reached 99% fitness at generation: {gen_99}")
         
-        print()
\ No newline at end of file
+        lines.append("")
+        print("\n".join(lines))
\ No newline at end of file
@@ -7,6 +7,8 @@ the genetic algorithm components to guess the secret number.
 
 import time
 import sys
+from array import array
+from collections import namedtuple
 from typing import Dict, Any, Tuple, Optional, List, Callable
 
 # These will be imported from the genetic_algorithm module when that's implemented
@@ -24,6 +26,10 @@ class Display:
     pass
 
 
+# A single row of the generation history, in show_generation_progress argument order
+GenerationRecord = namedtuple('GenerationRecord', ['generation', 'best_guess', 'best_fitness', 'avg_fitness'])
+
+
 class GameManager:
     """
     Manages the overall flow of the genetic algorithm number guessing game.
@@ -47,13 +53,63 @@ class GameManager:
         self.best_fitness = 0
         self.best_individual = None
         self.population = None
-        self.generation_history = []
+        self.generation_history = self._new_generation_history()
+        self._best_record_index = None
+        self._best_record_fitness = float('-inf')
         self.start_time = None
         self.end_time = None
+        self._max_generations = config.get('MAX_GENERATIONS', 1000)
+        
+        # Reused by get_statistics
+        self._statistics: Dict[str, Any] = {}
         
         # Observer pattern for visualization components
         self.observers = []
         
+    @staticmethod
+    def _new_generation_history() -> Dict[str, Any]:
+        """
+        Create an empty generation history.
+        
+        The history is stored column-wise (one sequence per field) rather than
+        as a list of per-generation dictionaries.
+        
+        Returns:
+            Dict[str, Any]: Dictionary mapping each field to its column
+        """
+        return {
+            'generation': array('i'),
+            'best_fitness': array('d'),
+            'best_guess': [],
+            'avg_fitness': array('d'),
+        }
+    
+    def record_generation(self, generation: int, best_fitness: float, best_guess: Any, avg_fitness: float) -> GenerationRecord:
+        """
+        Append one generation's results to the generation history.
+        
+        Args:
+            generation: The generation number
+            best_fitness: The fitness of the best individual
+            best_guess: The value of the best individual
+            avg_fitness: The average fitness of the population
+            
+        Returns:
+            GenerationRecord: The recorded row, ready for show_generation_progress
+        """
+        history = self.generation_history
+        history['generation'].append(generation)
+        history['best_fitness'].append(best_fitness)
+        history['best_guess'].append(best_guess)
+        history['avg_fitness'].append(avg_fitness)
+        
+        # Track the best generation so far so the results don't need a rescan
+        if best_fitness > self._best_record_fitness:
+            self._best_record_fitness = best_fitness
+            self._best_record_index = len(history['generation']) - 1
+        
+        return GenerationRecord(generation, best_guess, best_fitness, avg_fitness)
+    
     def add_observer(self, observer) -> None:
         """
         Add an observer that will be notified of game state changes.
@@ -76,6 +132,28 @@ class GameManager:
             if hasattr(observer, method_name):
                 handler = getattr(observer, method_name)
                 handler(data)
+    
+    def notify_observers_batch(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Notify all observers of several game state changes at once.
+        
+        Observers with an on_events method receive the whole batch in one call;
+        others get each event through their on_<event> methods, as with
+        notify_observers.
+        
+        Args:
+            events: The (event type, data) pairs, in the order they happened
+        """
+        for observer in self.observers:
+            on_events = getattr(observer, 'on_events', None)
+            if on_events is not None:
+                on_events(events)
+                continue
+            
+            for event_type, data in events:
+                handler = getattr(observer, f'on_{event_type}', None)
+                if handler is not None:
+                    handler(data)
         
     def setup_game(self) -> None:
         """
@@ -103,18 +181,12 @@ class GameManager:
         Returns:
             int: The secret number to be guessed
         """
-        min_number = self.config.get('MIN_NUMBER', 1)
-        max_number = self.config.get('MAX_NUMBER', 100)
-        
-        while True:
-            try:
-                number = self.display.get_secret_number(min_number, max_number)
-                if min_number <= number <= max_number:
-                    return number
-                else:
-                    self.display.show_error(f"Number must be between {min_number} and {max_number}.")
-            except ValueError:
-                self.display.show_error("Please enter a valid number.")
+        # Display.get_secret_number already re-prompts until the value is a
+        # valid in-range integer
+        return self.display.get_secret_number(
+            self.config.get('MIN_NUMBER', 1),
+            self.config.get('MAX_NUMBER', 100)
+        )
     
     def _set_game_parameters(self) -> None:
         """
@@ -173,31 +245,61 @@ class GameManager:
         
         self.display.show_generation_header()
         
+        # Loop invariants, looked up once instead of every generation
+        display_interval = self.config.get('DISPLAY_INTERVAL', 5)
+        max_generations = self._max_generations
+        run_generation = self._run_generation
+        
         # Main game loop
         while not solution_found:
             self.current_generation += 1
             
             # Run one generation of the genetic algorithm
-            solution_found = self._run_generation()
+            solution_found, record = run_generation()
             
             # Display progress every N generations or when solution is found
-            if solution_found or self.current_generation % self.config.get('DISPLAY_INTERVAL', 5) == 0:
-                self._display_progress()
+            if solution_found or self.current_generation % display_interval == 0:
+                self.display.show_generation_progress(*record)
             
             # Check for exit condition
-            if self.current_generation >= self.config.get('MAX_GENERATIONS', 1000):
-                self.display.show_max_generations_reached(self.config.get('MAX_GENERATIONS', 1000))
+            if self.current_generation >= max_generations:
+                self.display.show_max_generations_reached(max_generations)
                 break
         
         self.end_time = time.time()
         self._display_final_results()
     
-    def _run_generation(self) -> bool:
+    def run_generations(self, count: int) -> Tuple[int, bool]:
+        """
+        Run several generations in a row.
+        
+        Stops early when the solution is found or the generation limit is reached.
+        
+        Args:
+            count: The maximum number of generations to run
+            
+        Returns:
+            Tuple[int, bool]: The number of generations run, and whether the solution is found
+        """
+        run_generation = self._run_generation
+        remaining = min(count, self._max_generations - self.current_generation)
+        generations_run = 0
+        solution_found = False
+        
+        while generations_run < remaining and not solution_found:
+            self.current_generation += 1
+            solution_found, _ = run_generation()
+            generations_run += 1
+        
+        return generations_run, solution_found
+    
+    def _run_generation(self) -> Tuple[bool, GenerationRecord]:
         """
         Run a single generation of the genetic algorithm.
         
         Returns:
-            bool: True if the solution is found, False otherwise
+            Tuple[bool, GenerationRecord]: Whether the solution is found, and
+            the recorded results of this generation
         """
         # Notify observers before generation processing
         self.notify_observers('before_generation', {
@@ -219,13 +321,12 @@ class GameManager:
             best_fitness = best_individual.fitness
             
             # Record this generation's results
-            generation_record = {
-                'generation': self.current_generation,
-                'best_fitness': best_fitness,
-                'best_guess': best_individual.value,
-                'avg_fitness': self.population.get_average_fitness(),
-            }
-            self.generation_history.append(generation_record)
+            record = self.record_generation(
+                self.current_generation,
+                best_fitness,
+                best_individual.value,
+                self.population.get_average_fitness()
+            )
             
             # Update best individual tracking
             self.best_fitness = best_fitness
@@ -257,7 +358,7 @@ class GameManager:
                 'solution_found': solution_found
             })
             
-            return solution_found
+            return solution_found, record
         else:
             # For demonstration purposes (remove in actual implementation)
             # Simulate progress when population is not implemented yet
@@ -265,27 +366,14 @@ class GameManager:
             solution_found = self.best_fitness == 100
             
             # Record simulated results
-            generation_record = {
-                'generation': self.current_generation,
-                'best_fitness': self.best_fitness,
-                'best_guess': '?',
-                'avg_fitness': max(0, self.best_fitness - 10),
-            }
-            self.generation_history.append(generation_record)
+            record = self.record_generation(
+                self.current_generation,
+                self.best_fitness,
+                '?',
+                max(0, self.best_fitness - 10)
+            )
             
-            return solution_found
-    
-    def _display_progress(self) -> None:
-        """
-        Display the current progress of the genetic algorithm.
-        """
-        latest_gen = self.generation_history[-1]
-        self.display.show_generation_progress(
-            latest_gen['generation'],
-            latest_gen['best_guess'] if latest_gen['best_guess'] is not None else '?',
-            latest_gen['best_fitness'],
-            latest_gen['avg_fitness'] if latest_gen['avg_fitness'] is not None else 0
-        )
+            return solution_found, record
     
     def _display_final_results(self) -> None:
         """
@@ -297,21 +385,24 @@ class GameManager:
             self.secret_number,
             self.current_generation,
             elapsed_time,
-            self.generation_history
+            self.generation_history,
+            self._best_record_index
         )
     
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get the statistics of the game.
         
+        The same dictionary is reused and refreshed in place on every call.
+        
         Returns:
             Dict[str, Any]: Dictionary containing game statistics
         """
-        return {
-            'secret_number': self.secret_number,
-            'generations': self.current_generation,
-            'elapsed_time': self.end_time - self.start_time if self.end_time else 0,
-            'best_fitness': self.best_fitness,
-            'generation_history': self.generation_history,
-            'parameters': self.config
-        }
\ No newline at end of file
+        stats = self._statistics
+        stats['secret_number'] = self.secret_number
+        stats['generations'] = self.current_generation
+        stats['elapsed_time'] = self.end_time - self.start_time if self.end_time else 0
+        stats['best_fitness'] = self.best_fitness
+        stats['generation_history'] = self.generation_history
+        stats['parameters'] = self.config
+        return stats
\ No newline at end of file
@@ -6,11 +6,22 @@ Pygame, including population visualization, fitness landscapes, and statistics.
 """
 
 import os
+import queue
 import sys
+import threading
 import time
+
+# SDL reads its hints when the renderer is created, so they have to be in the
+# environment before pygame is imported and initialized. Render batching lets
+# SDL merge consecutive draw calls; user settings take precedence
+os.environ.setdefault('SDL_RENDER_BATCHING', '1')
+
 import pygame
+from functools import cached_property
 from typing import Dict, Any, List, Tuple, Optional, Union, Callable
 
+from genetic_algorithm.individual import Individual
+
 # Import visualization components
 from visualization.population_view import PopulationView
 from visualization.fitness_landscape import FitnessLandscape
@@ -18,7 +29,94 @@ from visualization.evolution_chart import EvolutionChart
 from visualization.operations_view import OperationsView
 from visualization.stats_dashboard import StatsDashboard
 from visualization.ui_components import Button, Slider, ToggleButton, TextBox
-from visualization.themes import get_theme
+from visualization.themes import get_font, get_theme
+
+
+# Event types handled by the visualizer; everything else is blocked at the SDL level
+WINDOW_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE]
+MOUSE_EVENTS = [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]
+
+# Frame rate while paused with nothing to redraw; input is still handled every frame
+PAUSED_FPS = 15
+
+
+class PopulationSnapshot:
+    """
+    Read-only copy of a population, taken when a generation is committed.
+    
+    The renderer only ever sees snapshots, so the evolution thread can keep
+    modifying the live population while a frame is being drawn. Values and
+    fitness are kept as flat columns instead of cloned Individual objects.
+    """
+    
+    def __init__(self, population):
+        """
+        Copy the current state of a population.
+        
+        Args:
+            population: The Population object to copy
+        """
+        columns = population.snapshot()
+        self.values = columns['values']
+        self.fitness = columns['fitness']
+        self.min_value = population.min_value
+        self.max_value = population.max_value
+        self.best_individual = population.get_best_individual().clone() if self.values else None
+        self.generation_stats = dict(population.get_statistics())
+    
+    @cached_property
+    def individuals(self) -> List[Individual]:
+        """
+        Rebuild Individual objects from the snapshot columns.
+        
+        Only the genetic operations view needs real individuals, so they are
+        created on first access rather than for every snapshot.
+        
+        Returns:
+            List[Individual]: The individuals, in population order
+        """
+        individuals = []
+        for value, fitness in zip(self.values, self.fitness):
+            individual = Individual(value, self.min_value, self.max_value)
+            individual.fitness = fitness
+            individuals.append(individual)
+        return individuals
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the value and fitness columns of the snapshot.
+        
+        Returns:
+            Dict[str, Any]: 'values' and 'fitness' columns, in population order
+        """
+        return {'values': self.values, 'fitness': self.fitness}
+    
+    def get_best_individual(self):
+        """
+        Get the best individual at the time of the snapshot.
+        
+        Returns:
+            Individual: The individual with the highest fitness
+        """
+        return self.best_individual
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get the population statistics at the time of the snapshot.
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing population statistics
+        """
+        return self.generation_stats
+    
+    def __len__(self) -> int:
+        """
+        Get the number of individuals in the snapshot.
+        
+        Returns:
+            int: The population size
+        """
+        return len(self.values)
 
 
 class PyGameVisualizer:
@@ -49,8 +147,12 @@ class PyGameVisualizer:
         self.screen = None
         self.clock = None
         self.font = None
+        self.banner_font = None
         self.theme = None
         
+        # Pre-rendered "SOLUTION FOUND!" banner: text, text rect and background rect
+        self._solution_banner = None
+        
         # Game state
         self.population = None
         self.secret_number = None
@@ -67,10 +169,38 @@ class PyGameVisualizer:
         self.evolution_chart = None
         self.operations_view = None
         self.stats_dashboard = None
+        self._component_list = ()
         
         # UI controls
         self.controls = {}
         self.active_component = None
+        
+        # Flat views of the controls for the per-frame and per-event loops
+        self._control_list = ()
+        self._event_controls = ()
+        
+        # Redraw tracking: the whole window, or only the controls strip
+        self._full_redraw = True
+        self._controls_dirty = True
+        self._banner_drawn = False
+        
+        # Evolution thread state. Component updates raised while a generation
+        # is computed are collected and published together once it is done
+        self._worker = None
+        self._worker_error = None
+        self._resume_event = threading.Event()
+        self._updates = queue.Queue(maxsize=2)
+        self._pending_updates = []
+        self._latest_snapshot = None
+        
+        # Observer handlers by event type, used by on_events
+        self._event_handlers = {
+            'before_generation': self.on_before_generation,
+            'after_fitness_evaluation': self.on_after_fitness_evaluation,
+            'before_next_generation': self.on_before_next_generation,
+            'after_next_generation': self.on_after_next_generation,
+            'after_generation': self.on_after_generation,
+        }
     
     def initialize(self) -> None:
         """Initialize Pygame and set up the display window."""
@@ -78,6 +208,10 @@ class PyGameVisualizer:
         pygame.init()
         pygame.font.init()
         
+        # Only queue the events we actually handle
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(WINDOW_EVENTS + MOUSE_EVENTS)
+        
         # Create window
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption("Genetic Algorithm Visualization")
@@ -87,12 +221,13 @@ class PyGameVisualizer:
         self.theme = get_theme(self.theme_name)
         
         # Set up fonts
-        self.font = pygame.font.SysFont(self.theme['font_name'], self.theme['font_size'])
+        self.font = get_font(self.theme['font_name'], self.theme['font_size'])
+        self.banner_font = get_font(self.theme['font_name'], 32)
         
         # Set icon if available
         icon_path = os.path.join(os.path.dirname(__file__), '../visualization/assets/icon.png')
         if os.path.exists(icon_path):
-            icon = pygame.image.load(icon_path)
+            icon = pygame.image.load(icon_path).convert_alpha()
             pygame.display.set_icon(icon)
     
     def setup(self, population, secret_number: int, config: Dict[str, Any]) -> None:
@@ -104,7 +239,7 @@ class PyGameVisualizer:
             secret_number: The secret number to guess
             config: Dictionary containing configuration parameters
         """
-        self.population = population
+        self.population = self._take_snapshot(population)
         self.secret_number = secret_number
         
         # Calculate layout based on visual_mode
@@ -154,8 +289,23 @@ class PyGameVisualizer:
             self.theme
         )
         
+        # Components checked by _needs_redraw
+        self._component_list = tuple(
+            component for component in (
+                self.population_view, self.fitness_landscape, self.evolution_chart,
+                self.operations_view, self.stats_dashboard
+            ) if component
+        )
+        
         # Set up UI controls
         self._setup_controls()
+        
+        # Pre-render the solution banner
+        text = self.banner_font.render("SOLUTION FOUND!", True, self.theme['success_color'])
+        text_rect = text.get_rect(center=(self.window_width // 2, 30))
+        banner_rect = pygame.Rect(text_rect.left - 10, text_rect.top - 5,
+                                  text_rect.width + 20, text_rect.height + 10)
+        self._solution_banner = (text, text_rect, banner_rect)
     
     def _setup_layout(self) -> None:
         """Set up the layout of visualization components based on visual_mode."""
@@ -261,6 +411,11 @@ class PyGameVisualizer:
             self._take_screenshot,
             self.theme
         )
+        
+        self._control_list = tuple(self.controls.values())
+        self._event_controls = tuple(
+            control for control in self._control_list if hasattr(control, 'handle_event')
+        )
     
     def update_generation_data(self, data: Dict[str, Any]) -> None:
         """
@@ -270,51 +425,178 @@ class PyGameVisualizer:
             data: Dictionary containing generation statistics
         """
         self.generation_data.append(data)
+        self._defer(self._show_generation_data, data)
+    
+    def _show_generation_data(self, data: Dict[str, Any]) -> None:
+        """
+        Pass new generation data on to the dashboard and the evolution chart.
+        
+        Args:
+            data: Dictionary containing generation statistics
+        """
         self.current_generation = data['generation']
         
         # Update stats dashboard
         if self.stats_dashboard:
             self.stats_dashboard.update_data(data)
         
-        # Update evolution chart
+        # Append to the evolution chart rather than rebuilding it from the whole history
         if self.evolution_chart:
-            self.evolution_chart.update_data(self.generation_data)
+            self.evolution_chart.add_data(data)
     
     def start_evolution_loop(self, game_manager) -> None:
         """
         Start the main evolution and visualization loop.
         
+        Generations are computed on a separate thread. This loop only handles
+        events and renders the generations that thread has committed.
+        
         Args:
             game_manager: The GameManager object controlling the algorithm
         """
         self.running = True
         self.paused = False
+        self._resume_event.set()
         
-        # Main loop
-        while self.running:
-            # Process events
-            self._process_events()
-            
-            # Update logic (if not paused)
-            if not self.paused:
-                # Run a generation of the genetic algorithm
-                if self.current_generation < self.config.get('MAX_GENERATIONS', 1000) and not self.solution_found:
-                    # Run at the specified speed (multiple generations per frame if speed > 1)
-                    for _ in range(self.speed):
-                        solution_found = game_manager._run_generation()
-                        if solution_found or self.current_generation >= self.config.get('MAX_GENERATIONS', 1000):
-                            self.solution_found = solution_found
-                            break
-            
-            # Render visualization
-            self._render()
+        self._worker = threading.Thread(
+            target=self._evolution_worker,
+            args=(game_manager,),
+            name='evolution',
+            daemon=True
+        )
+        self._worker.start()
+        
+        # Events are polled no faster than the frame rate
+        poll_interval = 1.0 / self.fps
+        next_poll = time.perf_counter()
+        
+        try:
+            # Main loop
+            while self.running:
+                # Process events
+                now = time.perf_counter()
+                if now >= next_poll:
+                    self._process_events()
+                    # Step from the previous deadline so clock jitter doesn't skip frames
+                    next_poll = max(next_poll + poll_interval, now)
+                
+                # Pick up the generations committed since the last frame
+                self._apply_updates()
+                if self._worker_error:
+                    raise self._worker_error
+                
+                # Render visualization
+                self._render()
+                
+                # Cap the frame rate, and idle at a lower one while paused
+                if self.paused and not self._needs_redraw():
+                    self.clock.tick(PAUSED_FPS)
+                else:
+                    self.clock.tick(self.fps)
+        finally:
+            # Wake up a paused worker so it sees that we stopped running
+            self.running = False
+            self._resume_event.set()
+            self._worker.join()
+            self._worker = None
+    
+    def _evolution_worker(self, game_manager) -> None:
+        """
+        Run generations until the solution is found or the limit is reached.
+        
+        Runs on the evolution thread, at most `speed` generations per frame.
+        
+        Args:
+            game_manager: The GameManager object controlling the algorithm
+        """
+        max_generations = self.config.get('MAX_GENERATIONS', 1000)
+        frame_interval = 1.0 / self.fps
+        next_frame_at = time.perf_counter()
+        
+        try:
+            while self.running and game_manager.current_generation < max_generations:
+                # Block while paused
+                if not self._resume_event.wait(0.1):
+                    continue
+                
+                # Run `speed` generations per frame
+                now = time.perf_counter()
+                if now < next_frame_at:
+                    time.sleep(next_frame_at - now)
+                next_frame_at = max(now, next_frame_at) + frame_interval
+                
+                _, solution_found = game_manager.run_generations(self.speed)
+                
+                # Commit the generations
+                updates, self._pending_updates = self._pending_updates, []
+                self._publish(updates)
+                
+                if solution_found:
+                    break
+        except Exception as e:
+            self._worker_error = e
+    
+    def _defer(self, func: Callable, *args) -> None:
+        """
+        Apply a component update, or hold it back until the generation is committed.
+        
+        Updates raised on the evolution thread are collected and handed to the
+        main loop once the generation is complete; anywhere else they apply at once.
+        
+        Args:
+            func: The update to apply
+            *args: Arguments for the update
+        """
+        if threading.current_thread() is self._worker:
+            self._pending_updates.append((func, args))
+        else:
+            func(*args)
+    
+    def _publish(self, updates: List[Tuple[Callable, tuple]]) -> None:
+        """
+        Hand a committed generation's updates to the main loop.
+        
+        When the renderer falls behind, the oldest uncollected generation is dropped.
+        
+        Args:
+            updates: The component updates of the generation
+        """
+        while True:
+            try:
+                self._updates.put_nowait(updates)
+                return
+            except queue.Full:
+                try:
+                    self._updates.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _apply_updates(self) -> None:
+        """Apply the component updates of all committed generations."""
+        while True:
+            try:
+                updates = self._updates.get_nowait()
+            except queue.Empty:
+                return
+            for func, args in updates:
+                func(*args)
+    
+    def _take_snapshot(self, population) -> PopulationSnapshot:
+        """
+        Copy the population for the renderer.
+        
+        Args:
+            population: The live Population object
             
-            # Cap the frame rate
-            self.clock.tick(self.fps)
+        Returns:
+            PopulationSnapshot: The copy, also kept as the latest snapshot
+        """
+        self._latest_snapshot = PopulationSnapshot(population)
+        return self._latest_snapshot
     
     def _process_events(self) -> None:
         """Process pygame events."""
-        for event in pygame.event.get():
+        for event in pygame.event.get(WINDOW_EVENTS):
             # Quit event
             if event.type == pygame.QUIT:
                 self.running = False
@@ -330,58 +612,163 @@ class PyGameVisualizer:
                 elif event.key == pygame.K_s:
                     self._take_screenshot()
             
-            # Mouse events for controls
-            elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_pos = pygame.mouse.get_pos()
-                mouse_buttons = pygame.mouse.get_pressed()
-                
-                # Pass event to controls
-                for control_name, control in self.controls.items():
-                    if hasattr(control, 'handle_event'):
-                        control.handle_event(event, mouse_pos, mouse_buttons)
+            # The window contents were lost (e.g. uncovered or restored)
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True
+        
+        # Mouse events for controls, handled as one batch
+        mouse_events = pygame.event.get(MOUSE_EVENTS)
+        if mouse_events:
+            mouse_buttons = pygame.mouse.get_pressed()
+            
+            # Pass events to controls. Each event carries its own position, and
+            # motion events their button states, so SDL isn't queried per event
+            for event in mouse_events:
+                if event.type == pygame.MOUSEMOTION:
+                    event_buttons = event.buttons
+                else:
+                    event_buttons = mouse_buttons
+                for control in self._event_controls:
+                    control.handle_event(event, event.pos, event_buttons)
+            self._controls_dirty = True
     
     def _render(self) -> None:
-        """Render all visualization components to the screen."""
-        # Clear the screen
-        self.screen.fill(self.theme['background_color'])
+        """
+        Render the visualization components that changed since the last frame.
+        
+        Only dirty components are redrawn, and only their areas are pushed to
+        the display. The whole window is flipped instead when most of it changed.
+        """
+        # Nothing changed since the last frame, so leave the display as it is
+        if not self._needs_redraw():
+            return
+        
+        screen = self.screen
+        background_color = self.theme['background_color']
+        full_redraw = self._full_redraw
+        dirty_rects = []
+        
+        if full_redraw:
+            screen.fill(background_color)
         
         # Render visualization components if they exist
+        components = []
         if self.population_view and self.population:
-            self.population_view.render(self.screen, self.population)
+            components.append((self.population_view, (self.population,)))
         
         if self.fitness_landscape and self.population:
-            self.fitness_landscape.render(self.screen, self.population)
+            components.append((self.fitness_landscape, (self.population,)))
         
         if self.evolution_chart:
-            self.evolution_chart.render(self.screen)
+            components.append((self.evolution_chart, ()))
         
         if self.operations_view and self.population:
-            self.operations_view.render(self.screen, self.population)
+            components.append((self.operations_view, (self.population,)))
         
         if self.stats_dashboard:
-            self.stats_dashboard.render(self.screen)
+            components.append((self.stats_dashboard, ()))
+        
+        # Unchanged components are blitted back from their cached surfaces in
+        # one call, flushed before any re-render so the drawing order is kept
+        cached_blits = []
+        for component, args in components:
+            rect = component.get_rect()
+            # Also redraw panels overlapping an area that was just redrawn
+            if full_redraw or component.dirty or rect.collidelist(dirty_rects) != -1:
+                if component.dirty or component.cached_surface is None:
+                    if cached_blits:
+                        screen.blits(cached_blits, doreturn=False)
+                        cached_blits = []
+                    self._draw_component(component, args)
+                else:
+                    cached_blits.append((component.cached_surface, rect))
+                dirty_rects.append(rect)
+        
+        if cached_blits:
+            screen.blits(cached_blits, doreturn=False)
         
         # Render controls
-        for control_name, control in self.controls.items():
-            control.render(self.screen)
+        controls_rect = self.layout['controls']
+        if full_redraw or self._controls_dirty or controls_rect.collidelist(dirty_rects) != -1:
+            # Restore whatever lies underneath before drawing the controls again
+            if self._controls_dirty and not full_redraw:
+                screen.fill(background_color, controls_rect)
+                screen.set_clip(controls_rect)
+                screen.blits([
+                    (component.cached_surface, component.get_rect())
+                    for component, args in components
+                    if component.cached_surface and component.get_rect().colliderect(controls_rect)
+                ], doreturn=False)
+                screen.set_clip(None)
+            
+            for control in self._control_list:
+                control.render(screen)
+            self._controls_dirty = False
+            dirty_rects.append(controls_rect)
         
         # Show solution found message if applicable
         if self.solution_found:
-            font = pygame.font.SysFont(self.theme['font_name'], 32)
-            text = font.render("SOLUTION FOUND!", True, self.theme['success_color'])
-            text_rect = text.get_rect(center=(self.window_width // 2, 30))
-            pygame.draw.rect(self.screen, self.theme['panel_color'], 
-                           pygame.Rect(text_rect.left - 10, text_rect.top - 5, 
-                                     text_rect.width + 20, text_rect.height + 10))
-            self.screen.blit(text, text_rect)
+            text, text_rect, banner_rect = self._solution_banner
+            if not self._banner_drawn or banner_rect.collidelist(dirty_rects) != -1:
+                pygame.draw.rect(screen, self.theme['panel_color'], banner_rect)
+                screen.blit(text, text_rect)
+                self._banner_drawn = True
+                dirty_rects.append(banner_rect)
+        
+        # Update the display, in full only when most of the window changed
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if full_redraw or dirty_area > 0.5 * self.window_width * self.window_height:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        
+        self._full_redraw = False
+    
+    def _needs_redraw(self) -> bool:
+        """
+        Check whether anything on screen changed since the last frame.
+        
+        Returns:
+            bool: True if the next frame has something to draw
+        """
+        if self._full_redraw or self._controls_dirty:
+            return True
+        if self.solution_found and not self._banner_drawn:
+            return True
+        return any(component.dirty for component in self._component_list)
+    
+    def _draw_component(self, component, args: Tuple) -> None:
+        """
+        Draw a visualization component onto the screen.
+        
+        Components are only re-rendered when dirty; otherwise the surface cached
+        from their last render is blitted back.
         
-        # Update the display
-        pygame.display.flip()
+        Args:
+            component: The visualization component to draw
+            args: Extra arguments for the component's render method
+        """
+        rect = component.get_rect()
+        if component.dirty or component.cached_surface is None:
+            self.screen.fill(self.theme['background_color'], rect)
+            component.dirty = False
+            component.render(self.screen, *args)
+            component.cached_surface = self.screen.subsurface(rect).copy()
+        else:
+            self.screen.blit(component.cached_surface, rect)
     
     def _toggle_pause(self) -> None:
         """Toggle the pause state of the evolution."""
         self.paused = not self.paused
+        if self.paused:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+        
+        # Nothing moves while paused, so the paused loop can idle without redrawing
+        self._set_animations_running(not self.paused and not self.solution_found)
         self.controls['play_pause'].toggle()
+        self._controls_dirty = True
     
     def _step_evolution(self) -> None:
         """Advance one generation when in paused state."""
@@ -400,6 +787,9 @@ class PyGameVisualizer:
         if self.stats_dashboard:
             self.stats_dashboard.reset()
         
+        self._banner_drawn = False
+        self._full_redraw = True
+        
         # Reset Population would need to be handled by the game_manager
     
     def _change_speed(self, new_speed: int) -> None:
@@ -423,30 +813,75 @@ class PyGameVisualizer:
         pygame.quit()
     
     # Observer pattern methods
+    # These are called from the evolution thread, so they only take snapshots
+    # of the population and defer the component updates to the main loop
+    def on_events(self, events) -> None:
+        """Handle a batch of events, in order, with one observer call."""
+        handlers = self._event_handlers
+        for event_type, data in events:
+            handler = handlers.get(event_type)
+            if handler is not None:
+                handler(data)
+    
     def on_before_generation(self, data) -> None:
         """Handle before_generation event."""
         if self.operations_view:
-            self.operations_view.prepare_new_generation(data['population'])
+            # The population is unchanged since the previous generation was created
+            snapshot = self._latest_snapshot or self._take_snapshot(data['population'])
+            self._defer(self.operations_view.prepare_new_generation, snapshot)
     
     def on_after_fitness_evaluation(self, data) -> None:
         """Handle after_fitness_evaluation event."""
+        self._defer(self._show_population, self._take_snapshot(data['population']))
+    
+    def _show_population(self, snapshot: PopulationSnapshot) -> None:
+        """
+        Show an evaluated population in the population view and the fitness landscape.
+        
+        Args:
+            snapshot: Snapshot of the evaluated population
+        """
+        self.population = snapshot
+        
         if self.fitness_landscape:
-            self.fitness_landscape.update_population(data['population'])
+            self.fitness_landscape.update_population(snapshot)
         
         if self.population_view:
-            self.population_view.update_population(data['population'])
+            self.population_view.update_population(snapshot)
     
     def on_before_next_generation(self, data) -> None:
         """Handle before_next_generation event."""
         if self.operations_view:
-            self.operations_view.prepare_genetic_operations(data['population'])
+            # Taken right after the fitness evaluation
+            self._defer(self.operations_view.prepare_genetic_operations, self._latest_snapshot)
     
     def on_after_next_generation(self, data) -> None:
         """Handle after_next_generation event."""
+        snapshot = self._take_snapshot(data['population'])
         if self.operations_view:
-            self.operations_view.finish_genetic_operations(data['population'])
+            self._defer(self.operations_view.finish_genetic_operations, snapshot)
     
     def on_after_generation(self, data) -> None:
         """Handle after_generation event."""
         if data['solution_found']:
-            self.solution_found = True
\ No newline at end of file
+            self._defer(self._show_solution_found)
+    
+    def _show_solution_found(self) -> None:
+        """Mark the solution as found once its generation is on screen."""
+        self.solution_found = True
+        self._set_animations_running(False)
+    
+    def _set_animations_running(self, running: bool) -> None:
+        """
+        Start or stop the animations that redraw without new data.
+        
+        The best individual's pulse and the elapsed-time clock only run while
+        evolution is in progress, so a paused or finished display stops redrawing.
+        
+        Args:
+            running: Whether the animations should run
+        """
+        if self.population_view:
+            self.population_view.set_pulsing(running)
+        if self.stats_dashboard:
+            self.stats_dashboard.set_clock_running(running)
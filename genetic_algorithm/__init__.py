@@ -11,6 +11,7 @@ from .selection import Selection
 from .crossover import Crossover
 from .mutation import Mutation
 from .fitness import FitnessCalculator
+from .rng import set_seed
 
 __all__ = [
     'Individual', 
@@ -18,5 +19,6 @@ __all__ = [
     'Selection',
     'Crossover',
     'Mutation',
-    'FitnessCalculator'
+    'FitnessCalculator',
+    'set_seed'
 ]
\ No newline at end of file
@@ -5,10 +5,10 @@ This module provides different crossover methods for combining individuals
 to create offspring in the genetic algorithm.
 """
 
-import random
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Sequence
 
 from .individual import Individual
+from .rng import rng
 
 
 class Crossover:
@@ -37,7 +37,7 @@ class Crossover:
         max_value = parent1.max_value
         
         # Generate random weights
-        weight = random.random()
+        weight = rng.random()
         
         # Create child values using weighted averages
         child1_value = int(weight * parent1.value + (1 - weight) * parent2.value)
@@ -76,14 +76,14 @@ class Crossover:
         
         # If parents have identical values, create diversity
         if difference == 0:
-            variation1 = random.randint(1, 3)
-            variation2 = random.randint(1, 3)
+            variation1 = rng.randint(1, 3)
+            variation2 = rng.randint(1, 3)
             child1_value = max(min_value, min(average + variation1, max_value))
             child2_value = max(min_value, min(average - variation2, max_value))
         else:
             # Create children that explore around the parents
-            variation1 = random.randint(-difference, difference)
-            variation2 = random.randint(-difference, difference)
+            variation1 = rng.randint(-difference, difference)
+            variation2 = rng.randint(-difference, difference)
             child1_value = max(min_value, min(average + variation1, max_value))
             child2_value = max(min_value, min(average + variation2, max_value))
         
@@ -93,13 +93,172 @@ class Crossover:
         
         return child1, child2
     
+    @staticmethod
+    def arithmetic_crossover_batch(parent1_values: Sequence[int], parent2_values: Sequence[int],
+                                   min_value: int, max_value: int) -> Tuple[List[int], List[int]]:
+        """
+        Perform arithmetic crossover for a whole mating pool at once.
+        
+        Works on plain values instead of Individual objects; pair i of the
+        result comes from crossing parent1_values[i] with parent2_values[i].
+        
+        Args:
+            parent1_values: Values of the first parent of each pair
+            parent2_values: Values of the second parent of each pair
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Tuple[List[int], List[int]]: The values of the first and second child of each pair
+        """
+        rand = rng.random
+        child1_values = []
+        child2_values = []
+        
+        for value1, value2 in zip(parent1_values, parent2_values):
+            # Create child values using weighted averages
+            weight = rand()
+            child1_value = int(weight * value1 + (1 - weight) * value2)
+            child2_value = int((1 - weight) * value1 + weight * value2)
+            
+            # Ensure values are within range
+            child1_values.append(min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value)
+            child2_values.append(min_value if child2_value < min_value else max_value if child2_value > max_value else child2_value)
+        
+        return child1_values, child2_values
+    
+    @staticmethod
+    def average_crossover_batch(parent1_values: Sequence[int], parent2_values: Sequence[int],
+                                min_value: int, max_value: int) -> Tuple[List[int], List[int]]:
+        """
+        Perform average crossover for a whole mating pool at once.
+        
+        Works on plain values instead of Individual objects; pair i of the
+        result comes from crossing parent1_values[i] with parent2_values[i].
+        
+        Args:
+            parent1_values: Values of the first parent of each pair
+            parent2_values: Values of the second parent of each pair
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Tuple[List[int], List[int]]: The values of the first and second child of each pair
+        """
+        rand = rng.random
+        child1_values = []
+        child2_values = []
+        
+        # Random integers are drawn by scaling rng.random(), which is much
+        # cheaper than rng.randint and has the same distribution
+        for value1, value2 in zip(parent1_values, parent2_values):
+            average = (value1 + value2) // 2
+            difference = abs(value1 - value2)
+            
+            # If parents have identical values, create diversity
+            if difference == 0:
+                child1_value = average + 1 + int(rand() * 3)
+                child2_value = average - 1 - int(rand() * 3)
+            else:
+                span = 2 * difference + 1
+                child1_value = average - difference + int(rand() * span)
+                child2_value = average - difference + int(rand() * span)
+            
+            # Ensure values are within range
+            child1_values.append(min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value)
+            child2_values.append(min_value if child2_value < min_value else max_value if child2_value > max_value else child2_value)
+        
+        return child1_values, child2_values
+    
+    @staticmethod
+    def binary_crossover_batch(parent1_values: Sequence[int], parent2_values: Sequence[int],
+                               min_value: int, max_value: int) -> Tuple[List[int], List[int]]:
+        """
+        Perform binary crossover for a whole mating pool at once.
+        
+        Works on plain values instead of Individual objects; pair i of the
+        result comes from crossing parent1_values[i] with parent2_values[i].
+        
+        Args:
+            parent1_values: Values of the first parent of each pair
+            parent2_values: Values of the second parent of each pair
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Tuple[List[int], List[int]]: The values of the first and second child of each pair
+        """
+        rand = rng.random
+        max_bits = max_value.bit_length()
+        child1_values = []
+        child2_values = []
+        
+        # Masks for every crossover point, so the loop only does lookups
+        low_masks = [(1 << (max_bits - point)) - 1 for point in range(max_bits)]
+        
+        for value1, value2 in zip(parent1_values, parent2_values):
+            # Keep the high bits, swap the low ones
+            low_mask = low_masks[1 + int(rand() * (max_bits - 1))]
+            child1_value = (value1 & ~low_mask) | (value2 & low_mask)
+            child2_value = (value2 & ~low_mask) | (value1 & low_mask)
+            
+            # Ensure values are within range
+            child1_values.append(min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value)
+            child2_values.append(min_value if child2_value < min_value else max_value if child2_value > max_value else child2_value)
+        
+        return child1_values, child2_values
+    
+    @staticmethod
+    def binary_two_point_crossover_batch(parent1_values: Sequence[int], parent2_values: Sequence[int],
+                                         min_value: int, max_value: int) -> Tuple[List[int], List[int]]:
+        """
+        Perform binary two-point crossover for a whole mating pool at once.
+        
+        Works on plain values instead of Individual objects; pair i of the
+        result comes from crossing parent1_values[i] with parent2_values[i].
+        
+        Args:
+            parent1_values: Values of the first parent of each pair
+            parent2_values: Values of the second parent of each pair
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Tuple[List[int], List[int]]: The values of the first and second child of each pair
+        """
+        rand = rng.random
+        max_bits = max_value.bit_length()
+        child1_values = []
+        child2_values = []
+        
+        # Masks for every (point1, point2) pair, so the loop only does lookups
+        mid_masks = [
+            [((1 << (max_bits - point1)) - 1) ^ ((1 << (max_bits - point2)) - 1)
+             for point2 in range(max_bits)]
+            for point1 in range(max_bits)
+        ]
+        
+        for value1, value2 in zip(parent1_values, parent2_values):
+            # Swap the bits between two distinct crossover points
+            point1 = 1 + int(rand() * (max_bits - 2))
+            point2 = point1 + 1 + int(rand() * (max_bits - 1 - point1))
+            mid_mask = mid_masks[point1][point2]
+            child1_value = (value1 & ~mid_mask) | (value2 & mid_mask)
+            child2_value = (value2 & ~mid_mask) | (value1 & mid_mask)
+            
+            # Ensure values are within range
+            child1_values.append(min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value)
+            child2_values.append(min_value if child2_value < min_value else max_value if child2_value > max_value else child2_value)
+        
+        return child1_values, child2_values
+    
     @staticmethod
     def binary_crossover(parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         """
         Perform binary crossover between two individuals.
         
-        This method converts the parent values to binary, performs crossover,
-        and converts back to integers.
+        This method treats the parent values as fixed-width bit strings and swaps
+        the bits after a random crossover point, using integer bit masks.
         
         Args:
             parent1: First parent individual
@@ -111,21 +270,16 @@ class Crossover:
         min_value = parent1.min_value
         max_value = parent1.max_value
         
-        # Convert parent values to binary strings
-        max_bits = len(bin(max_value)) - 2  # -2 to remove '0b' prefix
-        parent1_bits = format(parent1.value, f'0{max_bits}b')
-        parent2_bits = format(parent2.value, f'0{max_bits}b')
-        
-        # Choose a random crossover point
-        crossover_point = random.randint(1, max_bits - 1)
+        # Width of the bit strings
+        max_bits = parent1._n_bits
         
-        # Perform single-point crossover
-        child1_bits = parent1_bits[:crossover_point] + parent2_bits[crossover_point:]
-        child2_bits = parent2_bits[:crossover_point] + parent1_bits[crossover_point:]
+        # Choose a random crossover point (counted from the most significant bit)
+        crossover_point = rng.randint(1, max_bits - 1)
         
-        # Convert binary strings back to integers
-        child1_value = int(child1_bits, 2)
-        child2_value = int(child2_bits, 2)
+        # Perform single-point crossover: keep the high bits, swap the low ones
+        low_mask = (1 << (max_bits - crossover_point)) - 1
+        child1_value = (parent1.value & ~low_mask) | (parent2.value & low_mask)
+        child2_value = (parent2.value & ~low_mask) | (parent1.value & low_mask)
         
         # Ensure values are within range
         child1_value = max(min_value, min(child1_value, max_value))
@@ -142,8 +296,8 @@ class Crossover:
         """
         Perform binary two-point crossover between two individuals.
         
-        This method converts the parent values to binary, performs two-point crossover,
-        and converts back to integers.
+        This method treats the parent values as fixed-width bit strings and swaps
+        the bits between two random crossover points, using integer bit masks.
         
         Args:
             parent1: First parent individual
@@ -155,22 +309,17 @@ class Crossover:
         min_value = parent1.min_value
         max_value = parent1.max_value
         
-        # Convert parent values to binary strings
-        max_bits = len(bin(max_value)) - 2  # -2 to remove '0b' prefix
-        parent1_bits = format(parent1.value, f'0{max_bits}b')
-        parent2_bits = format(parent2.value, f'0{max_bits}b')
+        # Width of the bit strings
+        max_bits = parent1._n_bits
         
-        # Choose two distinct random crossover points
-        point1 = random.randint(1, max_bits - 2)
-        point2 = random.randint(point1 + 1, max_bits - 1)
+        # Choose two distinct random crossover points (counted from the most significant bit)
+        point1 = rng.randint(1, max_bits - 2)
+        point2 = rng.randint(point1 + 1, max_bits - 1)
         
-        # Perform two-point crossover
-        child1_bits = parent1_bits[:point1] + parent2_bits[point1:point2] + parent1_bits[point2:]
-        child2_bits = parent2_bits[:point1] + parent1_bits[point1:point2] + parent2_bits[point2:]
-        
-        # Convert binary strings back to integers
-        child1_value = int(child1_bits, 2)
-        child2_value = int(child2_bits, 2)
+        # Perform two-point crossover: swap the bits between the two points
+        mid_mask = ((1 << (max_bits - point1)) - 1) ^ ((1 << (max_bits - point2)) - 1)
+        child1_value = (parent1.value & ~mid_mask) | (parent2.value & mid_mask)
+        child2_value = (parent2.value & ~mid_mask) | (parent1.value & mid_mask)
         
         # Ensure values are within range
         child1_value = max(min_value, min(child1_value, max_value))
@@ -210,4 +359,61 @@ class Crossover:
             return Crossover.binary_two_point_crossover(parent1, parent2)
         else:  # Very different parents
             # Use average crossover to focus the search
-            return Crossover.average_crossover(parent1, parent2)
\ No newline at end of file
+            return Crossover.average_crossover(parent1, parent2)
+    
+    @staticmethod
+    def adaptive_crossover_batch(parent1_values: Sequence[int], parent2_values: Sequence[int],
+                                 min_value: int, max_value: int) -> Tuple[List[int], List[int]]:
+        """
+        Perform adaptive crossover for a whole mating pool at once.
+        
+        The pairs are first split by the same similarity thresholds as
+        adaptive_crossover, then each group is crossed by its batch method in
+        a single call and the results are put back in pair order.
+        
+        Args:
+            parent1_values: Values of the first parent of each pair
+            parent2_values: Values of the second parent of each pair
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Tuple[List[int], List[int]]: The values of the first and second child of each pair
+        """
+        range_size = max_value - min_value
+        binary_limit = range_size * 0.05
+        two_point_limit = range_size * 0.20
+        
+        # Group the pair indices by strategy
+        groups = ([], [], [])
+        for index, (value1, value2) in enumerate(zip(parent1_values, parent2_values)):
+            difference = abs(value1 - value2)
+            if difference < binary_limit:  # Very similar parents
+                groups[0].append(index)
+            elif difference < two_point_limit:  # Moderately similar parents
+                groups[1].append(index)
+            else:  # Very different parents
+                groups[2].append(index)
+        
+        child1_values = [0] * len(parent1_values)
+        child2_values = [0] * len(parent1_values)
+        strategies = (
+            Crossover.binary_crossover_batch,
+            Crossover.binary_two_point_crossover_batch,
+            Crossover.average_crossover_batch,
+        )
+        
+        # Cross each group in one call and scatter the children back
+        for indices, strategy in zip(groups, strategies):
+            if not indices:
+                continue
+            group1, group2 = strategy(
+                [parent1_values[i] for i in indices],
+                [parent2_values[i] for i in indices],
+                min_value, max_value
+            )
+            for index, child1_value, child2_value in zip(indices, group1, group2):
+                child1_values[index] = child1_value
+                child2_values[index] = child2_value
+        
+        return child1_values, child2_values
@@ -5,9 +5,140 @@ This module provides different fitness functions for evaluating
 individuals in the genetic algorithm.
 """
 
-from typing import Optional, Callable, List
+import math
+import os
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Callable, List, Sequence
 from .individual import Individual
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+# Largest range whose exponential decay factors are precomputed; the table for
+# the default range of a million values would take a noticeable time and 8 MB
+_EXP_DECAY_TABLE_MAX_RANGE = 65536
+
+
+@lru_cache(maxsize=4)
+def _exp_decay_table(range_size: int) -> array:
+    """
+    Get the exponential decay factor for every distance within a range.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        array: exp(-5 * distance / range_size), indexed by distance
+    """
+    # Scale factor for exponential decay (adjust as needed)
+    scale_factor = 5.0 / range_size
+    return array('d', [math.exp(-scale_factor * distance) for distance in range(range_size + 1)])
+
+
+def _exp_decay(distance: int, range_size: int) -> float:
+    """
+    Look up the exponential decay factor for a distance.
+    
+    Args:
+        distance: The distance from the secret number
+        range_size: The number of possible values
+        
+    Returns:
+        float: exp(-5 * distance / range_size)
+    """
+    if range_size <= _EXP_DECAY_TABLE_MAX_RANGE:
+        table = _exp_decay_table(range_size)
+        if type(distance) is int and distance < len(table):
+            return table[distance]
+    # Large ranges and guesses outside the range (or between integers) aren't
+    # covered by the table
+    return math.exp(-5.0 / range_size * distance)
+
+
+def _exp_decay_lookup(range_size: int) -> Callable[[int], float]:
+    """
+    Get a function giving the exponential decay factor for a distance within a range.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        Callable[[int], float]: The table lookup for small ranges, math.exp otherwise
+    """
+    if range_size <= _EXP_DECAY_TABLE_MAX_RANGE:
+        return _exp_decay_table(range_size).__getitem__
+    scale_factor = 5.0 / range_size
+    return lambda distance: math.exp(-scale_factor * distance)
+
+
+def _distances(values: Sequence[int], secret_number: int) -> List[int]:
+    """
+    Get the distance of every guess from the secret number.
+    
+    This is the common first step of all batch fitness calculations.
+    
+    Args:
+        values: The guessed numbers
+        secret_number: The target number
+        
+    Returns:
+        List[int]: The distances, in the same order as values
+    """
+    return [abs(secret_number - value) for value in values]
+
+
+# Worker processes for FitnessCalculator.evaluate_population_parallel, started
+# on first use and shut down at exit. The pid of the process that started them
+# tells an inherited copy (after a fork) from this process's own pool. The
+# pool is rarely used, so its modules are only imported when it is created
+_EXECUTOR: Optional['ProcessPoolExecutor'] = None
+_EXECUTOR_WORKERS = 0
+_EXECUTOR_PID = 0
+_EXECUTOR_SHUTDOWN_REGISTERED = False
+
+
+def _get_executor(n_workers: int) -> 'ProcessPoolExecutor':
+    """
+    Get the shared process pool, (re)creating it for the requested number of workers.
+    
+    Args:
+        n_workers: The number of worker processes
+        
+    Returns:
+        ProcessPoolExecutor: The process pool
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS, _EXECUTOR_PID, _EXECUTOR_SHUTDOWN_REGISTERED
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # A pool inherited from the parent process can't be used or shut down here
+    if _EXECUTOR is not None and _EXECUTOR_PID != os.getpid():
+        _EXECUTOR = None
+    
+    if _EXECUTOR is None or _EXECUTOR_WORKERS != n_workers:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False)
+        _EXECUTOR = ProcessPoolExecutor(max_workers=n_workers)
+        _EXECUTOR_WORKERS = n_workers
+        _EXECUTOR_PID = os.getpid()
+        
+        if not _EXECUTOR_SHUTDOWN_REGISTERED:
+            import atexit
+            atexit.register(_shutdown_executor)
+            _EXECUTOR_SHUTDOWN_REGISTERED = True
+    return _EXECUTOR
+
+
+def _shutdown_executor() -> None:
+    """
+    Shut down the shared process pool, if this process started one.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is not None and _EXECUTOR_PID == os.getpid():
+        _EXECUTOR.shutdown(wait=True)
+        _EXECUTOR = None
+
 
 class FitnessCalculator:
     """
@@ -114,11 +245,8 @@ class FitnessCalculator:
             # Range of possible values
             range_size = max_value - min_value + 1
             
-            # Scale factor for exponential decay (adjust as needed)
-            scale_factor = 5.0 / range_size
-            
             # Calculate exponential decay
-            fitness = 99.0 * (2.718 ** (-scale_factor * distance))
+            fitness = 99.0 * _exp_decay(distance, range_size)
             
             return fitness
     
@@ -150,8 +278,7 @@ class FitnessCalculator:
             linear_fitness = max(0.0, range_size - distance) / range_size
             
             # Calculate exponential component
-            scale_factor = 5.0 / range_size
-            exp_fitness = 2.718 ** (-scale_factor * distance)
+            exp_fitness = _exp_decay(distance, range_size)
             
             # Combine with weights (60% linear, 40% exponential)
             combined = (0.6 * linear_fitness + 0.4 * exp_fitness) * 99.0
@@ -192,16 +319,140 @@ class FitnessCalculator:
         if previous_guess is not None:
             prev_distance = abs(secret_number - previous_guess)
             
-            # Bonus for moving in the right direction
-            if distance < prev_distance:
-                # Moving closer - give bonus
-                direction_bonus = 10.0
-            elif distance > prev_distance:
-                # Moving away - give penalty
-                direction_bonus = -5.0
+            # Bonus for moving closer, penalty for moving away
+            direction_bonus = 10.0 * (distance < prev_distance) - 5.0 * (distance > prev_distance)
         
         return max(0.0, min(99.0, basic_fitness + direction_bonus))
     
+    @staticmethod
+    def hot_cold_guidance_batch(values: Sequence[int], secret_number: int, min_value: int, max_value: int,
+                                previous_values: Optional[Sequence[int]] = None) -> array:
+        """
+        Calculate hot/cold guidance fitness for many guesses at once.
+        
+        Args:
+            values: The guessed numbers
+            secret_number: The target number
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            previous_values: The previous guess for each value (if any)
+            
+        Returns:
+            array: The fitness of each guess, in the same order as values
+        """
+        range_size = max_value - min_value + 1
+        distances = _distances(values, secret_number)
+        
+        if previous_values is None:
+            return array('d', _hot_cold_guidance_batch(distances, range_size))
+        
+        fitness_values = array('d')
+        for distance, prev_distance in zip(distances, _distances(previous_values, secret_number)):
+            if distance == 0:
+                fitness_values.append(100.0)
+                continue
+            fitness = (max(0.0, range_size - distance) / range_size * 90.0
+                       + 10.0 * (distance < prev_distance) - 5.0 * (distance > prev_distance))
+            fitness_values.append(0.0 if fitness < 0.0 else 99.0 if fitness > 99.0 else fitness)
+        return fitness_values
+    
+    @staticmethod
+    def get_fitness_function(method: str) -> Callable:
+        """
+        Get the fitness function for a FITNESS_METHOD name.
+        
+        Args:
+            method: The fitness method name ('linear', 'inverse', 'exponential', 'combined' or 'hot_cold')
+            
+        Returns:
+            Callable: The fitness function (linear_distance for unknown names)
+        """
+        return _FITNESS_METHODS.get(method, FitnessCalculator.linear_distance)
+    
+    @staticmethod
+    def specialize(fitness_function: Callable, min_value: int, max_value: int) -> Callable[[int, int], float]:
+        """
+        Get a version of a fitness function with the value range fixed.
+        
+        The range stays the same for a whole run, so the constants derived from
+        it are calculated once here instead of on every call.
+        
+        Args:
+            fitness_function: The fitness function to specialize
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Callable[[int, int], float]: A function taking (guess, secret_number)
+        """
+        factory = _SPECIALIZED_FACTORIES.get(fitness_function)
+        if factory is not None:
+            return factory(max_value - min_value + 1)
+        
+        # Custom fitness functions just get the range passed along
+        def fitness(guess: int, secret_number: int) -> float:
+            return fitness_function(guess, secret_number, min_value, max_value)
+        
+        return fitness
+    
+    @staticmethod
+    def evaluate_values(values: Sequence[int], secret_number: int, min_value: int, max_value: int,
+                        fitness_function: Callable = None) -> array:
+        """
+        Calculate the fitness of many guesses at once.
+        
+        The built-in distance-based functions have batch kernels that work on
+        the whole column of distances instead of one function call per guess.
+        
+        Args:
+            values: The guessed numbers
+            secret_number: The target number
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            fitness_function: The fitness function to use (defaults to linear_distance)
+            
+        Returns:
+            array: The fitness of each guess, in the same order as values
+        """
+        evaluate_batch = FitnessCalculator.batch_evaluator(fitness_function, min_value, max_value)
+        return evaluate_batch(values, secret_number)
+    
+    @staticmethod
+    def batch_evaluator(fitness_function: Optional[Callable], min_value: int,
+                        max_value: int) -> Callable[[Sequence[int], int], array]:
+        """
+        Get a batch fitness function for a fixed value range.
+        
+        The batch kernel and the constants derived from the range are looked up
+        once here, so a population can keep the result for its whole run.
+        
+        Args:
+            fitness_function: The fitness function to use (defaults to linear_distance)
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Callable[[Sequence[int], int], array]: A function taking (values, secret_number)
+            and returning the fitness of each value, in the same order
+        """
+        if fitness_function is None:
+            fitness_function = FitnessCalculator.linear_distance
+        
+        range_size = max_value - min_value + 1
+        kernel = _BATCH_KERNELS.get(fitness_function)
+        fitness = FitnessCalculator.specialize(fitness_function, min_value, max_value)
+        
+        def evaluate_batch(values: Sequence[int], secret_number: int) -> array:
+            distances = _distances(values, secret_number)
+            
+            # Table-based kernels only cover distances inside the range
+            if kernel is not None and (not distances or max(distances) <= range_size):
+                return array('d', kernel(distances, range_size))
+            
+            return array('d', [fitness(value, secret_number) for value in values])
+        
+        return evaluate_batch
+    
     @staticmethod
     def evaluate_population(population: List[Individual], secret_number: int, 
                            fitness_function: Callable = None) -> None:
@@ -213,20 +464,291 @@ class FitnessCalculator:
             secret_number: The target number
             fitness_function: The fitness function to use (defaults to linear_distance)
         """
-        # Use default fitness function if none provided
-        if fitness_function is None:
-            fitness_function = FitnessCalculator.linear_distance
+        if not population:
+            return
+        
+        # All individuals of a population share the same value range
+        fitness_values = FitnessCalculator.evaluate_values(
+            [individual.value for individual in population],
+            secret_number,
+            population[0].min_value,
+            population[0].max_value,
+            fitness_function
+        )
+        
+        for individual, fitness in zip(population, fitness_values):
+            individual.fitness = fitness
+    
+    @staticmethod
+    def evaluate_population_parallel(population: List[Individual], secret_number: int,
+                                     fitness_function: Callable = None,
+                                     n_workers: Optional[int] = None) -> None:
+        """
+        Evaluate fitness for all individuals in a population using several processes.
+        
+        The values are split into one chunk per worker and each chunk is evaluated
+        with evaluate_values in a shared process pool. The built-in fitness functions
+        are cheap, so this only pays off for very large populations or expensive
+        custom fitness functions; those must be picklable (module-level functions).
+        
+        Args:
+            population: List of individuals to evaluate
+            secret_number: The target number
+            fitness_function: The fitness function to use (defaults to linear_distance)
+            n_workers: The number of worker processes (defaults to the number of CPUs)
+        """
+        import multiprocessing
+        
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        
+        # Nothing to gain from a pool with a single worker or chunk; daemonic
+        # processes (such as multiprocessing.Pool workers) can't start one
+        if n_workers <= 1 or len(population) < 2 or multiprocessing.current_process().daemon:
+            FitnessCalculator.evaluate_population(population, secret_number, fitness_function)
+            return
+        
+        values = [individual.value for individual in population]
+        min_value = population[0].min_value
+        max_value = population[0].max_value
+        
+        # One contiguous chunk per worker
+        chunk_size = -(-len(values) // n_workers)
+        chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
         
-        # Calculate fitness for each individual
-        for individual in population:
-            if fitness_function == FitnessCalculator.linear_distance:
-                # Use the individual's built-in method for the default function
-                individual.calculate_fitness(secret_number)
-            else:
-                # Use the provided custom fitness function
-                individual.fitness = fitness_function(
-                    individual.value, 
-                    secret_number, 
-                    individual.min_value, 
-                    individual.max_value
-                )
\ No newline at end of file
+        executor = _get_executor(n_workers)
+        results = executor.map(
+            FitnessCalculator.evaluate_values,
+            chunks,
+            [secret_number] * len(chunks),
+            [min_value] * len(chunks),
+            [max_value] * len(chunks),
+            [fitness_function] * len(chunks)
+        )
+        
+        # Write the results back in population order
+        index = 0
+        for fitness_values in results:
+            for fitness in fitness_values:
+                population[index].fitness = fitness
+                index += 1
+
+
+def _linear_distance_batch(distances: List[int], range_size: int) -> List[float]:
+    """
+    Batch version of FitnessCalculator.linear_distance.
+    
+    Args:
+        distances: The distances of the guesses from the secret number
+        range_size: The number of possible values
+        
+    Returns:
+        List[float]: The fitness of each guess
+    """
+    return [
+        100.0 if distance == 0 else max(0.0, range_size - distance) / range_size * 100.0
+        for distance in distances
+    ]
+
+
+def _inverse_distance_batch(distances: List[int], range_size: int) -> List[float]:
+    """
+    Batch version of FitnessCalculator.inverse_distance.
+    
+    Args:
+        distances: The distances of the guesses from the secret number
+        range_size: The number of possible values
+        
+    Returns:
+        List[float]: The fitness of each guess
+    """
+    min_inverse = 1.0 / range_size
+    inverse_span = 1.0 - min_inverse
+    return [
+        100.0 if distance == 0 else ((1.0 / distance - min_inverse) / inverse_span) * 99.0
+        for distance in distances
+    ]
+
+
+def _exponential_decay_batch(distances: List[int], range_size: int) -> List[float]:
+    """
+    Batch version of FitnessCalculator.exponential_decay.
+    
+    Args:
+        distances: The distances of the guesses from the secret number
+        range_size: The number of possible values
+        
+    Returns:
+        List[float]: The fitness of each guess
+    """
+    decay = _exp_decay_lookup(range_size)
+    return [
+        100.0 if distance == 0 else 99.0 * decay(distance)
+        for distance in distances
+    ]
+
+
+def _combined_fitness_batch(distances: List[int], range_size: int) -> List[float]:
+    """
+    Batch version of FitnessCalculator.combined_fitness.
+    
+    Args:
+        distances: The distances of the guesses from the secret number
+        range_size: The number of possible values
+        
+    Returns:
+        List[float]: The fitness of each guess
+    """
+    decay = _exp_decay_lookup(range_size)
+    return [
+        100.0 if distance == 0
+        else (0.6 * (max(0.0, range_size - distance) / range_size) + 0.4 * decay(distance)) * 99.0
+        for distance in distances
+    ]
+
+
+def _hot_cold_guidance_batch(distances: List[int], range_size: int) -> List[float]:
+    """
+    Batch version of FitnessCalculator.hot_cold_guidance without a previous guess.
+    
+    Args:
+        distances: The distances of the guesses from the secret number
+        range_size: The number of possible values
+        
+    Returns:
+        List[float]: The fitness of each guess
+    """
+    return [
+        100.0 if distance == 0 else min(99.0, max(0.0, range_size - distance) / range_size * 90.0)
+        for distance in distances
+    ]
+
+
+def _make_linear_distance(range_size: int) -> Callable[[int, int], float]:
+    """
+    Specialized version of FitnessCalculator.linear_distance.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        Callable[[int, int], float]: A function taking (guess, secret_number)
+    """
+    def linear_distance(guess: int, secret_number: int) -> float:
+        distance = abs(secret_number - guess)
+        if distance == 0:
+            return 100.0
+        remaining = range_size - distance
+        return remaining / range_size * 100.0 if remaining > 0 else 0.0
+    
+    return linear_distance
+
+
+def _make_inverse_distance(range_size: int) -> Callable[[int, int], float]:
+    """
+    Specialized version of FitnessCalculator.inverse_distance.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        Callable[[int, int], float]: A function taking (guess, secret_number)
+    """
+    min_inverse = 1.0 / range_size
+    inverse_span = 1.0 - min_inverse
+    
+    def inverse_distance(guess: int, secret_number: int) -> float:
+        distance = abs(secret_number - guess)
+        if distance == 0:
+            return 100.0
+        return ((1.0 / distance - min_inverse) / inverse_span) * 99.0
+    
+    return inverse_distance
+
+
+def _make_exponential_decay(range_size: int) -> Callable[[int, int], float]:
+    """
+    Specialized version of FitnessCalculator.exponential_decay.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        Callable[[int, int], float]: A function taking (guess, secret_number)
+    """
+    def exponential_decay(guess: int, secret_number: int) -> float:
+        distance = abs(secret_number - guess)
+        if distance == 0:
+            return 100.0
+        return 99.0 * _exp_decay(distance, range_size)
+    
+    return exponential_decay
+
+
+def _make_combined_fitness(range_size: int) -> Callable[[int, int], float]:
+    """
+    Specialized version of FitnessCalculator.combined_fitness.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        Callable[[int, int], float]: A function taking (guess, secret_number)
+    """
+    def combined_fitness(guess: int, secret_number: int) -> float:
+        distance = abs(secret_number - guess)
+        if distance == 0:
+            return 100.0
+        linear_fitness = max(0.0, range_size - distance) / range_size
+        return (0.6 * linear_fitness + 0.4 * _exp_decay(distance, range_size)) * 99.0
+    
+    return combined_fitness
+
+
+def _make_hot_cold_guidance(range_size: int) -> Callable[[int, int], float]:
+    """
+    Specialized version of FitnessCalculator.hot_cold_guidance without a previous guess.
+    
+    Args:
+        range_size: The number of possible values
+        
+    Returns:
+        Callable[[int, int], float]: A function taking (guess, secret_number)
+    """
+    def hot_cold_guidance(guess: int, secret_number: int) -> float:
+        distance = abs(secret_number - guess)
+        if distance == 0:
+            return 100.0
+        return max(0.0, min(99.0, max(0.0, range_size - distance) / range_size * 90.0))
+    
+    return hot_cold_guidance
+
+
+# Fitness functions by FITNESS_METHOD name
+_FITNESS_METHODS = {
+    'linear': FitnessCalculator.linear_distance,
+    'inverse': FitnessCalculator.inverse_distance,
+    'exponential': FitnessCalculator.exponential_decay,
+    'combined': FitnessCalculator.combined_fitness,
+    'hot_cold': FitnessCalculator.hot_cold_guidance,
+}
+
+
+# Factories for the specialized versions of the built-in fitness functions
+_SPECIALIZED_FACTORIES = {
+    FitnessCalculator.linear_distance: _make_linear_distance,
+    FitnessCalculator.inverse_distance: _make_inverse_distance,
+    FitnessCalculator.exponential_decay: _make_exponential_decay,
+    FitnessCalculator.combined_fitness: _make_combined_fitness,
+    FitnessCalculator.hot_cold_guidance: _make_hot_cold_guidance,
+}
+
+
+# Batch kernels for the fitness functions that only depend on the distance
+_BATCH_KERNELS = {
+    FitnessCalculator.linear_distance: _linear_distance_batch,
+    FitnessCalculator.inverse_distance: _inverse_distance_batch,
+    FitnessCalculator.exponential_decay: _exponential_decay_batch,
+    FitnessCalculator.combined_fitness: _combined_fitness_batch,
+    FitnessCalculator.hot_cold_guidance: _hot_cold_guidance_batch,
+}
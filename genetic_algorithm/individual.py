@@ -5,8 +5,9 @@ This module defines the Individual class, which represents a single guess
 in the population of the genetic algorithm.
 """
 
-import random
-from typing import Optional, List, Tuple, Union
+from typing import Optional, List, Sequence, Tuple, Union
+
+from .rng import rng
 
 
 class Individual:
@@ -17,6 +18,10 @@ class Individual:
     how close it is to the target secret number.
     """
     
+    # Individuals are created in large numbers, so they have a fixed set of
+    # attributes and no per-instance __dict__
+    __slots__ = ('min_value', 'max_value', 'value', 'fitness', '_range_size', '_n_bits')
+    
     def __init__(self, value: Optional[int] = None, min_value: int = 1, max_value: int = 100):
         """
         Initialize a new individual with an optional predefined value.
@@ -29,12 +34,18 @@ class Individual:
         self.min_value = min_value
         self.max_value = max_value
         
+        # Number of possible values, used by every fitness calculation
+        self._range_size = max_value - min_value + 1
+        
+        # Width of the value as a bit string, used by the binary operators
+        self._n_bits = max_value.bit_length()
+        
         # Generate a random value if none is provided
         if value is None:
-            self.value = random.randint(min_value, max_value)
+            self.value = rng.randint(min_value, max_value)
         else:
             # Ensure the provided value is within the valid range
-            self.value = max(min_value, min(value, max_value))
+            self.value = min_value if value < min_value else max_value if value > max_value else value
         
         self.fitness = 0.0
     
@@ -58,7 +69,7 @@ class Individual:
         else:
             # Fitness formula: MAX_NUMBER - abs(secret_number - guess)
             # This gives higher fitness to closer guesses
-            range_size = self.max_value - self.min_value + 1
+            range_size = self._range_size
             self.fitness = max(0.0, range_size - distance)
             
             # Normalize to a 0-100 scale for better readability
@@ -79,6 +90,28 @@ class Individual:
         Returns:
             Tuple[Individual, Individual]: Two new individuals created by crossover
         """
+        child1_value, child2_value = self.crossover_values(partner)
+        
+        # Create and return the new individuals
+        child1 = Individual(child1_value, self.min_value, self.max_value)
+        child2 = Individual(child2_value, self.min_value, self.max_value)
+        
+        return child1, child2
+    
+    def crossover_values(self, partner: 'Individual') -> Tuple[int, int]:
+        """
+        Perform the same crossover as crossover, returning only the offspring values.
+        
+        Args:
+            partner: Another individual to crossover with
+            
+        Returns:
+            Tuple[int, int]: The values of the two offspring
+        """
+        min_value = self.min_value
+        max_value = self.max_value
+        randint = rng.randint
+        
         # Calculate average and difference between the two values
         average = (self.value + partner.value) // 2
         difference = abs(self.value - partner.value)
@@ -86,25 +119,73 @@ class Individual:
         # If the values are identical, create slightly varied offspring
         if difference == 0:
             # Add small random variations to create diversity
-            child1_value = max(self.min_value, min(self.value + random.randint(1, 3), self.max_value))
-            child2_value = max(self.min_value, min(self.value - random.randint(1, 3), self.max_value))
+            child1_value = self.value + randint(1, 3)
+            child2_value = self.value - randint(1, 3)
         else:
             # Create two children that explore the range between and around the parents
             # Child 1: Explore around the average
-            child1_value = max(self.min_value, min(average + random.randint(-difference, difference), self.max_value))
+            child1_value = average + randint(-difference, difference)
+            child1_value = min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value
             
             # Child 2: Explore a different region around the average
-            offset = random.randint(-difference, difference)
+            offset = randint(-difference, difference)
             # Ensure the second child is different from the first
             while average + offset == child1_value:
-                offset = random.randint(-difference, difference)
-            child2_value = max(self.min_value, min(average + offset, self.max_value))
+                offset = randint(-difference, difference)
+            child2_value = average + offset
         
-        # Create and return the new individuals
-        child1 = Individual(child1_value, self.min_value, self.max_value)
-        child2 = Individual(child2_value, self.min_value, self.max_value)
+        # Ensure the values are within range (child 1 may already be)
+        child1_value = min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value
+        child2_value = min_value if child2_value < min_value else max_value if child2_value > max_value else child2_value
         
-        return child1, child2
+        return child1_value, child2_value
+    
+    @staticmethod
+    def crossover_values_batch(parent1_values: Sequence[int], parent2_values: Sequence[int],
+                               min_value: int, max_value: int) -> Tuple[List[int], List[int]]:
+        """
+        Perform the same crossover as crossover_values for a whole mating pool at once.
+        
+        Pair i of the result comes from crossing parent1_values[i] with parent2_values[i].
+        
+        Args:
+            parent1_values: Values of the first parent of each pair
+            parent2_values: Values of the second parent of each pair
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            
+        Returns:
+            Tuple[List[int], List[int]]: The values of the first and second child of each pair
+        """
+        rand = rng.random
+        child1_values = []
+        child2_values = []
+        
+        # Random integers are drawn by scaling rng.random(), which is much
+        # cheaper than rng.randint and has the same distribution
+        for value1, value2 in zip(parent1_values, parent2_values):
+            average = (value1 + value2) // 2
+            difference = value1 - value2 if value1 > value2 else value2 - value1
+            
+            # If the values are identical, create slightly varied offspring
+            if difference == 0:
+                child1_value = value1 + 1 + int(rand() * 3)
+                child2_value = value1 - 1 - int(rand() * 3)
+            else:
+                span = 2 * difference + 1
+                child1_value = average - difference + int(rand() * span)
+                child1_value = min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value
+                
+                # Ensure the second child is different from the first
+                child2_value = average - difference + int(rand() * span)
+                while child2_value == child1_value:
+                    child2_value = average - difference + int(rand() * span)
+            
+            # Ensure the values are within range (child 1 may already be)
+            child1_values.append(min_value if child1_value < min_value else max_value if child1_value > max_value else child1_value)
+            child2_values.append(min_value if child2_value < min_value else max_value if child2_value > max_value else child2_value)
+        
+        return child1_values, child2_values
     
     def mutate(self, mutation_range: Optional[int] = None, mutation_probability: float = 1.0) -> None:
         """
@@ -115,7 +196,7 @@ class Individual:
             mutation_probability: The probability of mutation occurring (0.0 to 1.0)
         """
         # Check if mutation should occur
-        if random.random() > mutation_probability:
+        if rng.random() > mutation_probability:
             return
         
         # Calculate default mutation range if not provided
@@ -123,15 +204,15 @@ class Individual:
             value_range = self.max_value - self.min_value
             mutation_range = max(1, value_range // 10)
         
-        # Generate a random change amount
-        change = random.randint(-mutation_range, mutation_range)
-        
-        # Ensure the change isn't zero (no mutation)
-        while change == 0:
-            change = random.randint(-mutation_range, mutation_range)
+        # Generate a random non-zero change amount: draw from one value fewer
+        # and shift the non-negative half up, skipping zero without retrying
+        change = rng.randint(-mutation_range, mutation_range - 1)
+        if change >= 0:
+            change += 1
         
         # Apply the change and ensure the value stays within range
-        self.value = max(self.min_value, min(self.value + change, self.max_value))
+        value = self.value + change
+        self.value = self.min_value if value < self.min_value else self.max_value if value > self.max_value else value
     
     def __str__(self) -> str:
         """
@@ -5,10 +5,46 @@ This module provides different mutation methods for introducing variation
 into individuals in the genetic algorithm.
 """
 
-import random
-from typing import Optional
+import math
+from typing import Any, Iterator, Optional, List, Sequence
 
 from .individual import Individual
+from .rng import rng
+
+
+def _mutation_positions(count: int, probability: float) -> Iterator[int]:
+    """
+    Pick the positions to mutate out of count, each with the given probability.
+    
+    Rather than drawing one random number per position, the gaps between
+    mutated positions are drawn from the matching geometric distribution, so
+    only about count * probability draws are needed.
+    
+    Args:
+        count: The number of positions
+        probability: The probability of each position being mutated
+        
+    Returns:
+        Iterator[int]: The mutated positions, in increasing order
+    """
+    if probability >= 1.0:
+        yield from range(count)
+        return
+    if probability <= 0.0:
+        return
+    
+    rand = rng.random
+    # log1p keeps tiny probabilities from rounding log(1 - p) to zero
+    log_keep = math.log1p(-probability)
+    position = -1
+    while True:
+        # Number of positions skipped before the next mutation, compared as a
+        # float first since it can be too large to convert to an int
+        gap = math.log(1.0 - rand()) / log_keep
+        if gap >= count - 1 - position:
+            return
+        position += 1 + int(gap)
+        yield position
 
 
 class Mutation:
@@ -32,25 +68,46 @@ class Mutation:
             mutation_range: The maximum range of mutation
             mutation_probability: The probability of mutation occurring
         """
-        # Check if mutation should occur
-        if random.random() > mutation_probability:
-            return
+        # Individual.mutate implements exactly this mutation
+        individual.mutate(mutation_range, mutation_probability)
+    
+    @staticmethod
+    def random_mutation_batch(values: Sequence[int], min_value: int, max_value: int,
+                              mutation_range: Optional[int] = None,
+                              mutation_probability: float = 1.0) -> List[int]:
+        """
+        Apply random value mutation to a whole column of values at once.
+        
+        Each value is mutated the same way as by random_mutation, but without
+        going through an Individual object per value.
         
+        Args:
+            values: The values to mutate
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            mutation_range: The maximum range of mutation (default: 10% of the value range)
+            mutation_probability: The probability of mutation occurring for each value
+            
+        Returns:
+            List[int]: The mutated values, in the same order
+        """
         # Calculate default mutation range if not provided
         if mutation_range is None:
-            value_range = individual.max_value - individual.min_value
-            mutation_range = max(1, value_range // 10)  # 10% of the range by default
+            mutation_range = max(1, (max_value - min_value) // 10)
         
-        # Generate a random change amount
-        change = random.randint(-mutation_range, mutation_range)
+        rand = rng.random
+        span = 2 * mutation_range
+        mutated = list(values)
         
-        # Ensure the change isn't zero (no mutation)
-        while change == 0:
-            change = random.randint(-mutation_range, mutation_range)
+        for index in _mutation_positions(len(mutated), mutation_probability):
+            # Non-zero change in [-mutation_range, mutation_range]
+            change = int(rand() * span) - mutation_range
+            if change >= 0:
+                change += 1
+            value = mutated[index] + change
+            mutated[index] = min_value if value < min_value else max_value if value > max_value else value
         
-        # Apply the change and ensure the value stays within range
-        individual.value = max(individual.min_value, 
-                              min(individual.value + change, individual.max_value))
+        return mutated
     
     @staticmethod
     def bit_flip_mutation(individual: Individual, mutation_probability: float = 0.1) -> None:
@@ -63,22 +120,18 @@ class Mutation:
             individual: The individual to mutate
             mutation_probability: The probability of each bit being flipped
         """
-        # Convert value to binary
-        max_bits = len(bin(individual.max_value)) - 2  # -2 to remove '0b' prefix
-        value_bits = format(individual.value, f'0{max_bits}b')
+        # Width of the value's bit string
+        max_bits = individual._n_bits
         
-        # Flip bits with the given probability
-        result_bits = ''
-        for bit in value_bits:
-            if random.random() < mutation_probability:
-                # Flip the bit
-                result_bits += '1' if bit == '0' else '0'
-            else:
-                # Keep the bit unchanged
-                result_bits += bit
+        # Pick the bits to flip with the given probability
+        rand = rng.random
+        flip_mask = 0
+        for bit in range(max_bits):
+            if rand() < mutation_probability:
+                flip_mask |= 1 << bit
         
-        # Convert back to integer
-        new_value = int(result_bits, 2)
+        # Flip them all at once
+        new_value = individual.value ^ flip_mask
         
         # Ensure the value stays within range
         individual.value = max(individual.min_value, 
@@ -97,11 +150,11 @@ class Mutation:
             mutation_probability: The probability of mutation occurring
         """
         # Check if mutation should occur
-        if random.random() > mutation_probability:
+        if rng.random() > mutation_probability:
             return
         
         # Set to either min or max value
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             individual.value = individual.min_value
         else:
             individual.value = individual.max_value
@@ -122,7 +175,7 @@ class Mutation:
             sigma: Standard deviation for the Gaussian distribution
         """
         # Check if mutation should occur
-        if random.random() > mutation_probability:
+        if rng.random() > mutation_probability:
             return
         
         # Calculate default sigma if not provided
@@ -131,15 +184,143 @@ class Mutation:
             sigma = value_range * 0.05  # 5% of the range by default
         
         # Generate change from Gaussian distribution
-        change = int(random.gauss(0, sigma))
+        offset = rng.gauss(0, sigma)
+        change = int(offset)
         
-        # Ensure the change isn't zero (no mutation)
-        while change == 0:
-            change = int(random.gauss(0, sigma))
+        # Ensure the change isn't zero (no mutation) by rounding away from zero
+        if change == 0:
+            change = 1 if offset >= 0 else -1
         
         # Apply the change and ensure the value stays within range
-        individual.value = max(individual.min_value, 
-                              min(individual.value + change, individual.max_value))
+        min_value, max_value = individual.min_value, individual.max_value
+        value = individual.value + change
+        individual.value = min_value if value < min_value else max_value if value > max_value else value
+    
+    @staticmethod
+    def gaussian_mutation_batch(values: Sequence[int], min_value: int, max_value: int,
+                                mutation_probability: float = 0.3,
+                                sigma: Optional[float] = None) -> List[int]:
+        """
+        Apply Gaussian mutation to a whole column of values at once.
+        
+        Each value is mutated the same way as by gaussian_mutation, but without
+        going through an Individual object per value.
+        
+        Args:
+            values: The values to mutate
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            mutation_probability: The probability of mutation occurring for each value
+            sigma: Standard deviation for the Gaussian distribution (default: 5% of the value range)
+            
+        Returns:
+            List[int]: The mutated values, in the same order
+        """
+        # Calculate default sigma if not provided
+        if sigma is None:
+            sigma = (max_value - min_value) * 0.05
+        
+        gauss = rng.gauss
+        mutated = list(values)
+        
+        for index in _mutation_positions(len(mutated), mutation_probability):
+            offset = gauss(0, sigma)
+            change = int(offset)
+            
+            # Ensure the change isn't zero (no mutation) by rounding away from zero
+            if change == 0:
+                change = 1 if offset >= 0 else -1
+            value = mutated[index] + change
+            mutated[index] = min_value if value < min_value else max_value if value > max_value else value
+        
+        return mutated
+    
+    @staticmethod
+    def boundary_mutation_batch(values: Sequence[int], min_value: int, max_value: int,
+                                mutation_probability: float = 0.05) -> List[int]:
+        """
+        Apply boundary mutation to a whole column of values at once.
+        
+        Args:
+            values: The values to mutate
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            mutation_probability: The probability of mutation occurring for each value
+            
+        Returns:
+            List[int]: The mutated values, in the same order
+        """
+        rand = rng.random
+        mutated = list(values)
+        
+        for index in _mutation_positions(len(mutated), mutation_probability):
+            # Set to either min or max value
+            mutated[index] = min_value if rand() < 0.5 else max_value
+        
+        return mutated
+    
+    @staticmethod
+    def bit_flip_mutation_batch(values: Sequence[int], min_value: int, max_value: int,
+                                mutation_probability: float = 0.1) -> List[int]:
+        """
+        Apply bit flip mutation to a whole column of values at once.
+        
+        Args:
+            values: The values to mutate
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            mutation_probability: The probability of each bit being flipped
+            
+        Returns:
+            List[int]: The mutated values, in the same order
+        """
+        n_bits = max_value.bit_length()
+        mutated = list(values)
+        
+        # Treat the bits of all values as one long sequence of flip positions
+        flipped = set()
+        for position in _mutation_positions(len(mutated) * n_bits, mutation_probability):
+            index, bit = divmod(position, n_bits)
+            mutated[index] ^= 1 << bit
+            flipped.add(index)
+        
+        # Ensure the flipped values stay within range
+        for index in flipped:
+            value = mutated[index]
+            mutated[index] = min_value if value < min_value else max_value if value > max_value else value
+        
+        return mutated
+    
+    @staticmethod
+    def apply_batch(values: Sequence[int], method: str, min_value: int, max_value: int,
+                    **params: Any) -> List[int]:
+        """
+        Apply one of the batch mutation methods to a whole column of values.
+        
+        Args:
+            values: The values to mutate
+            method: The mutation method ('random', 'gaussian', 'boundary' or 'bit_flip')
+            min_value: The minimum possible value
+            max_value: The maximum possible value
+            **params: The remaining arguments of the chosen batch method, which
+                default to those of the matching single-individual method
+            
+        Returns:
+            List[int]: The mutated values, in the same order
+            
+        Raises:
+            ValueError: If the mutation method has no batch version
+        """
+        batch_methods = {
+            'random': Mutation.random_mutation_batch,
+            'gaussian': Mutation.gaussian_mutation_batch,
+            'boundary': Mutation.boundary_mutation_batch,
+            'bit_flip': Mutation.bit_flip_mutation_batch,
+        }
+        if method not in batch_methods:
+            raise ValueError(f"No batch mutation for method '{method}'")
+        
+        return batch_methods[method](values, min_value=min_value, max_value=max_value, **params)
     
     @staticmethod
     def adaptive_mutation(individual: Individual, fitness: float, 
@@ -163,14 +344,18 @@ class Mutation:
         
         # Increase probability slightly based on generation
         # (to avoid stagnation in later generations)
-        generation_factor = min(0.3, generation / 1000)
-        mutation_probability = min(0.9, base_probability + generation_factor)
+        generation_factor = generation / 1000
+        if generation_factor > 0.3:
+            generation_factor = 0.3
+        mutation_probability = base_probability + generation_factor
+        if mutation_probability > 0.9:
+            mutation_probability = 0.9
         
         # Calculate mutation range based on fitness
         # Lower fitness = larger mutation range
         value_range = individual.max_value - individual.min_value
-        mutation_factor = 1.0 - (fitness_ratio ** 2)  # Squared to emphasize differences
+        mutation_factor = 1.0 - fitness_ratio * fitness_ratio  # Squared to emphasize differences
         mutation_range = max(1, int(value_range * 0.05 * (1 + 3 * mutation_factor)))
         
         # Apply mutation
-        Mutation.random_mutation(individual, mutation_range, mutation_probability)
\ No newline at end of file
+        individual.mutate(mutation_range, mutation_probability)
\ No newline at end of file
@@ -5,11 +5,65 @@ This module defines the Population class, which manages a collection of individu
 and controls the evolutionary process of the genetic algorithm.
 """
 
-import random
-import statistics
+import math
+from array import array
+from collections import namedtuple
+from bisect import bisect_left
+from itertools import accumulate
 from typing import List, Dict, Any, Tuple, Optional, Callable
 
 from .individual import Individual
+from .fitness import FitnessCalculator
+from .mutation import Mutation
+from .selection import Selection
+from .rng import rng
+
+
+# Genetic algorithm parameters, read from the configuration once per population
+GAParams = namedtuple('GAParams', ['min_value', 'max_value', 'population_size', 'crossover_rate',
+                                   'mutation_rate', 'mutation_range', 'elitism_count'])
+
+
+def ga_params_from_config(config: Dict[str, Any]) -> GAParams:
+    """
+    Read the genetic algorithm parameters from a configuration dictionary.
+    
+    Args:
+        config: Dictionary containing configuration parameters
+        
+    Returns:
+        GAParams: The parameters, with defaults for missing entries
+    """
+    min_value = config.get('MIN_NUMBER', 1)
+    max_value = config.get('MAX_NUMBER', 100)
+    
+    return GAParams(
+        min_value=min_value,
+        max_value=max_value,
+        population_size=config.get('POPULATION_SIZE', 20),
+        crossover_rate=config.get('CROSSOVER_RATE', 0.8),
+        mutation_rate=config.get('MUTATION_RATE', 0.1),
+        mutation_range=max(1, (max_value - min_value) // 10),  # 10% of the range by default
+        elitism_count=config.get('ELITISM_COUNT', 2)
+    )
+
+
+def _value_typecode(min_value: int, max_value: int) -> str:
+    """
+    Choose the narrowest array typecode that can hold every value in a range.
+    
+    Args:
+        min_value: The minimum possible value
+        max_value: The maximum possible value
+        
+    Returns:
+        str: The typecode for the population's value column
+    """
+    for typecode in ('b', 'h', 'i', 'l'):
+        bits = 8 * array(typecode).itemsize
+        if -(1 << (bits - 1)) <= min_value and max_value < (1 << (bits - 1)):
+            return typecode
+    return 'q'
 
 
 class Population:
@@ -27,23 +81,29 @@ class Population:
         Args:
             config: Dictionary containing configuration parameters
         """
-        # Store configuration parameters
-        self.min_value = config.get('MIN_NUMBER', 1)
-        self.max_value = config.get('MAX_NUMBER', 100)
-        self.population_size = config.get('POPULATION_SIZE', 20)
-        self.crossover_rate = config.get('CROSSOVER_RATE', 0.8)
-        self.mutation_rate = config.get('MUTATION_RATE', 0.1)
-        self.elitism_count = config.get('ELITISM_COUNT', 2)
-        
-        # Calculate mutation range based on the number range
-        value_range = self.max_value - self.min_value
-        self.mutation_range = max(1, value_range // 10)  # 10% of the range by default
-        
-        # Initialize population with random individuals
-        self.individuals = [
-            Individual(None, self.min_value, self.max_value)
-            for _ in range(self.population_size)
-        ]
+        # Store configuration parameters, read from the configuration once
+        self.params = ga_params_from_config(config)
+        (self.min_value, self.max_value, self.population_size, self.crossover_rate,
+         self.mutation_rate, self.mutation_range, self.elitism_count) = self.params
+        
+        # Running total of fitness for roulette wheel selection, built on first use
+        self._cumulative_fitness = None
+        
+        # Resolve the fitness function and its batch version once rather than on every evaluation
+        self.fitness_function = FitnessCalculator.get_fitness_function(config.get('FITNESS_METHOD', 'linear'))
+        self._evaluate_batch = FitnessCalculator.batch_evaluator(self.fitness_function, self.min_value, self.max_value)
+        
+        # Fitness of every value evaluated so far, valid for one secret number
+        self._fitness_cache: Dict[int, float] = {}
+        self._fitness_cache_secret = None
+        
+        # The population is stored as parallel value and fitness columns rather
+        # than a list of Individual objects; all values are drawn at once. The
+        # value column uses the narrowest integer type that fits the range
+        self._typecode = _value_typecode(self.min_value, self.max_value)
+        self.values = array(self._typecode, rng.choices(range(self.min_value, self.max_value + 1),
+                                                        k=self.population_size))
+        self.fitness = array('d', [0.0]) * self.population_size
         
         # Keep track of the best individual
         self.best_individual = None
@@ -64,35 +124,55 @@ class Population:
         Args:
             secret_number: The target number to guess
         """
-        # Calculate fitness for each individual
-        for individual in self.individuals:
-            individual.calculate_fitness(secret_number)
+        # Fitness only depends on the value, so values seen in earlier
+        # generations (elites, duplicates) are looked up rather than recalculated
+        cache = self._fitness_cache
+        if secret_number != self._fitness_cache_secret:
+            cache.clear()
+            self._fitness_cache_secret = secret_number
         
-        # Sort individuals by fitness (highest first)
-        self.individuals.sort(key=lambda ind: ind.fitness, reverse=True)
+        # Calculate fitness for the new values in one batch; the set of
+        # distinct values is kept for the diversity statistic
+        unique_values = set(self.values)
+        new_values = [value for value in unique_values if value not in cache]
+        if new_values:
+            cache.update(zip(new_values, self._evaluate_batch(new_values, secret_number)))
         
-        # Update the best individual
-        self.best_individual = self.individuals[0].clone()
+        self.fitness = array('d', map(cache.__getitem__, self.values))
+        self._cumulative_fitness = None
+        
+        # Update the best individual; the columns stay unsorted, since only
+        # the elites are needed in fitness order
+        self.best_individual = self._individual_at(self._best_position())
         
         # Calculate statistics
-        self._calculate_statistics()
+        self._calculate_statistics(len(unique_values))
     
-    def _calculate_statistics(self) -> None:
+    def _calculate_statistics(self, unique_values: int) -> None:
         """
         Calculate various statistics about the current population.
+        
+        Args:
+            unique_values: The number of distinct values in the population
         """
-        # Extract fitness values
-        fitness_values = [ind.fitness for ind in self.individuals]
+        # Fitness values
+        fitness_values = self.fitness
+        count = len(fitness_values)
         
-        # Calculate unique values
-        unique_values = len(set(ind.value for ind in self.individuals))
+        # Mean and sample standard deviation with two fsum passes, which are
+        # much cheaper than the exact fraction arithmetic of the statistics module
+        mean = math.fsum(fitness_values) / count
+        if count > 1:
+            std_dev = math.sqrt(math.fsum([(fitness - mean) ** 2 for fitness in fitness_values]) / (count - 1))
+        else:
+            std_dev = 0.0
         
         # Calculate statistics
         self.generation_stats = {
-            'avg_fitness': statistics.mean(fitness_values),
+            'avg_fitness': mean,
             'best_fitness': self.best_individual.fitness,
             'best_guess': self.best_individual.value,
-            'fitness_std_dev': statistics.stdev(fitness_values) if len(fitness_values) > 1 else 0.0,
+            'fitness_std_dev': std_dev,
             'unique_values': unique_values
         }
     
@@ -100,47 +180,181 @@ class Population:
         """
         Create the next generation of individuals through selection, crossover, and mutation.
         """
-        new_population = []
+        values = self.values
+        fitness = self.fitness
         
-        # Add elite individuals directly to the new population (if enabled)
-        if self.elitism_count > 0:
-            # Add copies of the best individuals
-            new_population.extend([
-                ind.clone() for ind in self.individuals[:self.elitism_count]
-            ])
+        # Add elite individuals directly to the new population (if enabled),
+        # copying their values and fitness rather than cloning objects
+        elite_positions = Selection.elite_positions(fitness, self.elitism_count)
+        new_values = array(self._typecode, [values[i] for i in elite_positions])
+        new_fitness = array('d', [fitness[i] for i in elite_positions])
         
-        # Fill the rest of the population with offspring
-        while len(new_population) < self.population_size:
-            # Select parents using tournament selection
-            parent1 = self._tournament_selection(3)  # Tournament size of 3
-            parent2 = self._tournament_selection(3)
+        offspring_count = self.population_size - len(new_values)
+        pair_count = max(0, (offspring_count + 1) // 2)
+        
+        if values and all(value == values[0] for value in values):
+            # Converged population: every tournament would pick the same value,
+            # so skip selection; crossover and mutation can still move it on
+            parent1_values = [values[0]] * pair_count
+            parent2_values = [values[0]] * pair_count
+        else:
+            # Select the parents for the rest of the population, running all
+            # tournaments at once (tournament size of 3)
+            parents = self._batch_tournament(2 * pair_count, 3)
+            
+            parent1_values = [values[i] for i in parents[0::2]]
+            parent2_values = [values[i] for i in parents[1::2]]
             
-            # Ensure parents are different if possible
-            attempts = 0
-            while parent1.value == parent2.value and attempts < 5:
-                parent2 = self._tournament_selection(3)
-                attempts += 1
+            # Give the second parent of pairs with identical parents one more
+            # tournament, all in one batch, and accept the result
+            duplicates = [pair for pair in range(pair_count) if parent1_values[pair] == parent2_values[pair]]
+            for pair, position in zip(duplicates, self._batch_tournament(len(duplicates), 3)):
+                parent2_values[pair] = values[position]
+        
+        # Decide for all pairs at once which ones perform crossover
+        rand = rng.random
+        crossover_rate = self.crossover_rate
+        crossed = [pair for pair in range(pair_count) if rand() < crossover_rate]
+        
+        # Cross the chosen pairs in a single batch
+        crossed_child1_values, crossed_child2_values = Individual.crossover_values_batch(
+            [parent1_values[pair] for pair in crossed],
+            [parent2_values[pair] for pair in crossed],
+            self.min_value, self.max_value
+        )
+        
+        # Without crossover the children copy the parents; scatter the crossed
+        # children into their pairs' places
+        child1_values = parent1_values
+        child2_values = parent2_values
+        for pair, child1, child2 in zip(crossed, crossed_child1_values, crossed_child2_values):
+            child1_values[pair] = child1
+            child2_values[pair] = child2
+        
+        # Interleave the children of each pair into the offspring column
+        offspring_values = [None] * (2 * pair_count)
+        offspring_values[0::2] = child1_values
+        offspring_values[1::2] = child2_values
+        del offspring_values[offspring_count:]
+        
+        # Apply mutation to all offspring in a single batch
+        offspring_values = Mutation.apply_batch(
+            offspring_values, 'random', self.min_value, self.max_value,
+            mutation_range=self.mutation_range,
+            mutation_probability=self.mutation_rate
+        )
+        
+        # Fill the rest of the population with offspring, which have no fitness yet
+        new_values.extend(offspring_values)
+        new_fitness.extend([0.0] * len(offspring_values))
+        
+        # Replace the old population with the new one
+        self.values = new_values
+        self.fitness = new_fitness
+        self._cumulative_fitness = None
+    
+    def advance(self, secret_number: int) -> bool:
+        """
+        Run one complete generation: evaluate fitness and, unless the secret
+        number was found, create the next generation.
+        
+        This is the same sequence of steps the game loop performs, as a single
+        call for runs that don't need to observe the intermediate states.
+        
+        Args:
+            secret_number: The target number to guess
             
-            # Perform crossover with some probability
-            if random.random() < self.crossover_rate:
-                child1, child2 = parent1.crossover(parent2)
-            else:
-                # No crossover, just clone the parents
-                child1, child2 = parent1.clone(), parent2.clone()
+        Returns:
+            bool: True if the best individual has found the secret number
+        """
+        self.evaluate_fitness(secret_number)
+        
+        # Same threshold as the game loop
+        solution_found = self.best_individual.fitness >= 99.99
+        if not solution_found:
+            self.create_next_generation()
+        
+        return solution_found
+    
+    def _best_position(self) -> int:
+        """
+        Find the individual with the highest fitness.
+        
+        Returns:
+            int: The first position holding the highest fitness
+        """
+        fitness = self.fitness
+        return fitness.index(max(fitness))
+    
+    def _individual_at(self, index: int) -> Individual:
+        """
+        Build an Individual from one entry of the population columns.
+        
+        Args:
+            index: The position in the population
             
-            # Apply mutation
-            child1.mutate(self.mutation_range, self.mutation_rate)
-            child2.mutate(self.mutation_range, self.mutation_rate)
+        Returns:
+            Individual: A new individual with the value and fitness at that position
+        """
+        individual = Individual(self.values[index], self.min_value, self.max_value)
+        individual.fitness = self.fitness[index]
+        return individual
+    
+    @property
+    def individuals(self) -> List[Individual]:
+        """
+        Get the population as a list of Individual objects.
+        
+        The objects are built from the columns on every access, so changes
+        made to them are not written back to the population.
+        
+        Returns:
+            List[Individual]: The individuals, in population order
+        """
+        return [self._individual_at(index) for index in range(len(self.values))]
+    
+    def _batch_tournament(self, n_winners: int, tournament_size: int) -> List[int]:
+        """
+        Run many tournament selections at once.
+        
+        The candidates of all tournaments are drawn in a single call. Unlike
+        _tournament_selection, a tournament may contain the same individual twice.
+        
+        Args:
+            n_winners: The number of tournaments to run
+            tournament_size: The number of individuals in each tournament
             
-            # Add children to the new population
-            new_population.append(child1)
-            if len(new_population) < self.population_size:
-                new_population.append(child2)
+        Returns:
+            List[int]: The position of the winner of each tournament
+        """
+        size = len(self.values)
+        tournament_size = min(tournament_size, size)
+        if n_winners <= 0 or tournament_size <= 0:
+            return []
         
-        # Replace the old population with the new one
-        self.individuals = new_population
+        candidates = rng.choices(range(size), k=n_winners * tournament_size)
+        
+        if tournament_size == 3:
+            # Unrolled version for the tournament size the population uses;
+            # like max, ties go to the earlier candidate
+            fitness = self.fitness
+            winners = []
+            candidate_iter = iter(candidates)
+            for first, second, third in zip(candidate_iter, candidate_iter, candidate_iter):
+                if fitness[second] > fitness[first]:
+                    first = second
+                if fitness[third] > fitness[first]:
+                    first = third
+                winners.append(first)
+            return winners
+        
+        fitness = self.fitness.__getitem__
+        return [
+            max(candidates[start:start + tournament_size], key=fitness)
+            for start in range(0, len(candidates), tournament_size)
+        ]
     
-    def _tournament_selection(self, tournament_size: int) -> Individual:
+    def _tournament_selection(self, tournament_size: int) -> int:
         """
         Select an individual using tournament selection.
         
@@ -148,40 +362,38 @@ class Population:
             tournament_size: The number of individuals to include in the tournament
             
         Returns:
-            Individual: The selected individual
+            int: The position of the selected individual
         """
-        # Select random individuals for the tournament
-        tournament = random.sample(self.individuals, min(tournament_size, len(self.individuals)))
-        
-        # Return the individual with the highest fitness
-        return max(tournament, key=lambda ind: ind.fitness)
+        # A single tournament of the batch version, which draws candidates with replacement
+        return self._batch_tournament(1, tournament_size)[0]
     
-    def _roulette_wheel_selection(self) -> Individual:
+    def _roulette_wheel_selection(self) -> int:
         """
         Select an individual using roulette wheel selection.
         
         Returns:
-            Individual: The selected individual
+            int: The position of the selected individual
         """
+        # Running total of fitness, calculated once per generation
+        if self._cumulative_fitness is None:
+            self._cumulative_fitness = list(accumulate(self.fitness))
+        cumulative_fitness = self._cumulative_fitness
+        
         # Calculate total fitness
-        total_fitness = sum(ind.fitness for ind in self.individuals)
+        total_fitness = cumulative_fitness[-1] if cumulative_fitness else 0
         
         # Handle case where all individuals have zero fitness
         if total_fitness == 0:
-            return random.choice(self.individuals)
+            return rng.randrange(len(self.fitness))
         
         # Generate a random value between 0 and the total fitness
-        selection_point = random.uniform(0, total_fitness)
+        selection_point = rng.uniform(0, total_fitness)
         
-        # Find the individual at the selection point
-        current_sum = 0
-        for individual in self.individuals:
-            current_sum += individual.fitness
-            if current_sum >= selection_point:
-                return individual
+        # Find the first individual whose running total reaches the selection point
+        index = bisect_left(cumulative_fitness, selection_point)
         
-        # Fallback (should not reach here)
-        return self.individuals[-1]
+        # Fallback for rounding at the very end of the wheel
+        return index if index < len(cumulative_fitness) else len(cumulative_fitness) - 1
     
     def get_best_individual(self) -> Individual:
         """
@@ -192,7 +404,7 @@ class Population:
         """
         if self.best_individual is None:
             # If best_individual hasn't been set yet, find it now
-            self.best_individual = max(self.individuals, key=lambda ind: ind.fitness)
+            self.best_individual = self._individual_at(self._best_position())
         
         return self.best_individual
     
@@ -205,6 +417,20 @@ class Population:
         """
         return self.generation_stats
     
+    def snapshot(self) -> Dict[str, array]:
+        """
+        Get a column-wise copy of the population's values and fitness.
+        
+        The copy is meant for display, so fitness is stored in single precision.
+        
+        Returns:
+            Dict[str, array]: 'values' and 'fitness' columns, in population order
+        """
+        return {
+            'values': self.values[:],
+            'fitness': array('f', self.fitness),
+        }
+    
     def get_average_fitness(self) -> float:
         """
         Get the average fitness of the population.
@@ -239,7 +465,7 @@ class Population:
         Returns:
             str: A string summary of the population
         """
-        return (f"Population(size={len(self.individuals)}, "
+        return (f"Population(size={len(self.values)}, "
                 f"avg_fitness={self.generation_stats['avg_fitness']:.2f}, "
                 f"best_fitness={self.generation_stats['best_fitness']:.2f})")
     
@@ -250,4 +476,4 @@ class Population:
         Returns:
             int: The number of individuals in the population
         """
-        return len(self.individuals)
\ No newline at end of file
+        return len(self.values)
\ No newline at end of file
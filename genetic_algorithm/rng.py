@@ -0,0 +1,24 @@
+"""
+Random number generation for the Genetic Algorithm.
+
+This module holds the random number generator shared by the genetic algorithm
+components, kept separate from the global one in the random module.
+"""
+
+import random
+from typing import Optional
+
+
+# Generator used by all genetic algorithm components. The visualization keeps
+# using the global one, so animations don't change the course of evolution
+rng = random.Random()
+
+
+def set_seed(seed: Optional[int] = None) -> None:
+    """
+    Seed the genetic algorithm's random number generator.
+    
+    Args:
+        seed: The seed to use. If None, the generator is seeded from system entropy.
+    """
+    rng.seed(seed)
@@ -5,10 +5,18 @@ This module provides different selection methods for choosing individuals
 from the population for reproduction.
 """
 
-import random
-from typing import List, Callable, Any
+import heapq
+from bisect import bisect_left
+from itertools import accumulate
+from operator import attrgetter
+from typing import List, Callable, Any, Optional, Sequence, Tuple
 
 from .individual import Individual
+from .rng import rng
+
+
+# Sort/selection key for fitness; a C-level getter is cheaper than a lambda per candidate
+_get_fitness = attrgetter('fitness')
 
 
 class Selection:
@@ -34,14 +42,32 @@ class Selection:
         Returns:
             Individual: The selected individual
         """
-        # Select random individuals for the tournament
-        tournament = random.sample(population, min(tournament_size, len(population)))
+        # Select random individuals for the tournament; drawing with replacement
+        # is cheaper than sample, and the occasional repeat barely affects selection
+        tournament = rng.choices(population, k=tournament_size)
         
         # Return the individual with the highest fitness
-        return max(tournament, key=lambda ind: ind.fitness)
+        return max(tournament, key=_get_fitness)
     
     @staticmethod
-    def roulette_wheel_selection(population: List[Individual]) -> Individual:
+    def cumulative_fitness(population: List[Individual]) -> List[float]:
+        """
+        Calculate the running total of fitness over a population.
+        
+        The result can be passed to roulette_wheel_selection to avoid
+        recomputing it when selecting several times from the same population.
+        
+        Args:
+            population: List of individuals
+            
+        Returns:
+            List[float]: The sum of the fitness of each individual and all before it
+        """
+        return list(accumulate(map(_get_fitness, population)))
+    
+    @staticmethod
+    def roulette_wheel_selection(population: List[Individual],
+                                 cumulative_fitness: Optional[List[float]] = None) -> Individual:
         """
         Select an individual using roulette wheel selection.
         
@@ -49,32 +75,56 @@ class Selection:
         
         Args:
             population: List of individuals to select from
+            cumulative_fitness: The population's cumulative fitness, if already calculated
             
         Returns:
             Individual: The selected individual
         """
+        if cumulative_fitness is None:
+            cumulative_fitness = Selection.cumulative_fitness(population)
+        
         # Calculate total fitness
-        total_fitness = sum(ind.fitness for ind in population)
+        total_fitness = cumulative_fitness[-1] if cumulative_fitness else 0
         
         # Handle case where all individuals have zero fitness
         if total_fitness == 0:
-            return random.choice(population)
+            return rng.choice(population)
         
         # Generate a random value between 0 and the total fitness
-        selection_point = random.uniform(0, total_fitness)
+        selection_point = rng.uniform(0, total_fitness)
+        
+        # Find the first individual whose running total reaches the selection point
+        index = bisect_left(cumulative_fitness, selection_point)
+        
+        # Fallback for rounding at the very end of the wheel
+        return population[index] if index < len(population) else population[-1]
+    
+    @staticmethod
+    def rank_population(population: List[Individual]) -> Tuple[List[Individual], List[int]]:
+        """
+        Sort a population by fitness and calculate its cumulative rank weights.
+        
+        The result can be passed to rank_selection to avoid sorting the
+        population again when selecting several times from it.
+        
+        Args:
+            population: List of individuals
+            
+        Returns:
+            Tuple[List[Individual], List[int]]: The population sorted by fitness
+            (highest first) and the running total of the rank weights in that order
+        """
+        # Sort population by fitness (highest first)
+        sorted_population = sorted(population, key=_get_fitness, reverse=True)
         
-        # Find the individual at the selection point
-        current_sum = 0
-        for individual in population:
-            current_sum += individual.fitness
-            if current_sum >= selection_point:
-                return individual
+        # Lower rank (higher index) means lower weight
+        cumulative_ranks = list(accumulate(range(len(sorted_population), 0, -1)))
         
-        # Fallback (should not reach here)
-        return population[-1]
+        return sorted_population, cumulative_ranks
     
     @staticmethod
-    def rank_selection(population: List[Individual]) -> Individual:
+    def rank_selection(population: List[Individual],
+                       ranking: Optional[Tuple[List[Individual], List[int]]] = None) -> Individual:
         """
         Select an individual using rank selection.
         
@@ -83,30 +133,24 @@ class Selection:
         
         Args:
             population: List of individuals to select from
+            ranking: The result of rank_population for this population, if already calculated
             
         Returns:
             Individual: The selected individual
         """
-        # Sort population by fitness (highest first)
-        sorted_population = sorted(population, key=lambda ind: ind.fitness, reverse=True)
-        
-        # Calculate selection weights based on rank
-        ranks = list(range(1, len(sorted_population) + 1))
-        rank_sum = sum(ranks)
+        if ranking is None:
+            ranking = Selection.rank_population(population)
+        sorted_population, cumulative_ranks = ranking
         
         # Select based on rank probabilities
-        selection_point = random.uniform(0, rank_sum)
-        current_sum = 0
-        
-        for i, individual in enumerate(sorted_population):
-            # Lower rank (higher index) means lower probability
-            rank = len(sorted_population) - i
-            current_sum += rank
-            if current_sum >= selection_point:
-                return individual
-        
-        # Fallback (should not reach here)
-        return sorted_population[-1]
+        rank_sum = cumulative_ranks[-1]
+        selection_point = rng.uniform(0, rank_sum)
+        
+        # Find the first individual whose running total reaches the selection point
+        index = bisect_left(cumulative_ranks, selection_point)
+        
+        # Fallback for rounding at the very end of the ranks
+        return sorted_population[index] if index < len(sorted_population) else sorted_population[-1]
     
     @staticmethod
     def stochastic_universal_sampling(population: List[Individual], num_selections: int) -> List[Individual]:
@@ -124,34 +168,32 @@ class Selection:
             List[Individual]: The selected individuals
         """
         # Calculate total fitness
-        total_fitness = sum(ind.fitness for ind in population)
+        cumulative_fitness = Selection.cumulative_fitness(population)
+        total_fitness = cumulative_fitness[-1] if cumulative_fitness else 0
         
         # Handle case where all individuals have zero fitness
         if total_fitness == 0:
-            return random.choices(population, k=num_selections)
+            return rng.choices(population, k=num_selections)
         
         # Calculate distance between pointers
         pointer_distance = total_fitness / num_selections
         
         # Generate random start point for first pointer
-        start = random.uniform(0, pointer_distance)
+        start = rng.uniform(0, pointer_distance)
         
         # Create pointers
         pointers = [start + i * pointer_distance for i in range(num_selections)]
         
-        # Select individuals
+        # Select individuals; the pointers are increasing, so each search
+        # starts where the previous one ended
         selected = []
+        last = len(population) - 1
+        index = 0
         for pointer in pointers:
-            current_sum = 0
-            for individual in population:
-                current_sum += individual.fitness
-                if current_sum >= pointer:
-                    selected.append(individual)
-                    break
+            index = bisect_left(cumulative_fitness, pointer, index)
             
-            # Fallback if no individual was selected (should not happen)
-            if len(selected) < len(pointers):
-                selected.append(population[-1])
+            # Fallback for rounding at the very end of the wheel
+            selected.append(population[index] if index <= last else population[last])
         
         return selected
     
@@ -170,6 +212,25 @@ class Selection:
         Returns:
             List[Individual]: The n best individuals
         """
-        # Sort population by fitness (highest first) and select top n
-        sorted_population = sorted(population, key=lambda ind: ind.fitness, reverse=True)
-        return [ind.clone() for ind in sorted_population[:n]]
\ No newline at end of file
+        # Select the top n by fitness (highest first) without sorting the whole population
+        best = heapq.nlargest(n, population, key=_get_fitness)
+        return [ind.clone() for ind in best]
+    
+    @staticmethod
+    def elite_positions(fitness: Sequence[float], n: int) -> List[int]:
+        """
+        Find the positions of the n best entries of a fitness column.
+        
+        This is the column version of elitism_selection: the elites can be
+        copied as plain values without building or cloning Individual objects.
+        
+        Args:
+            fitness: The fitness of each individual
+            n: Number of top individuals to select
+            
+        Returns:
+            List[int]: The positions of the n best individuals (highest fitness first)
+        """
+        if n <= 0:
+            return []
+        return heapq.nlargest(n, range(len(fitness)), key=fitness.__getitem__)
@@ -8,8 +8,11 @@ the genetic algorithm components and game flow.
 import os
 import sys
 import argparse
+import hashlib
+import json
 import time
-from typing import Dict, Any, Optional
+from multiprocessing import Pool
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import game components
 from game.game_manager import GameManager
@@ -22,6 +25,7 @@ from genetic_algorithm.selection import Selection
 from genetic_algorithm.crossover import Crossover
 from genetic_algorithm.mutation import Mutation
 from genetic_algorithm.fitness import FitnessCalculator
+from genetic_algorithm.rng import rng, set_seed
 
 # Import utility components
 from utils.config import Config, DEFAULT_CONFIG
@@ -92,6 +96,21 @@ def parse_arguments():
     parser.add_argument('--quiet', action='store_true',
                        help='Run in quiet mode with minimal output')
     
+    parser.add_argument('--fast', action='store_true',
+                       help='Skip interactive pauses (for batch runs)')
+    
+    parser.add_argument('--repetitions', type=int, default=1,
+                       help='Run the algorithm this many times without interaction and report combined statistics')
+    
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of worker processes for repeated runs')
+    
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Seed of the first repeated run; run i uses seed + i')
+    
+    parser.add_argument('--cache', action='store_true',
+                       help='Reuse results of identical repeated runs cached on disk (timings are those of the cached runs)')
+    
     return parser.parse_args()
 
 
@@ -125,7 +144,8 @@ def configure_from_args(args) -> Config:
         'MUTATION_METHOD': args.mutation,
         'FITNESS_METHOD': args.fitness,
         'USE_COLORS': not args.no_color,
-        'VERBOSE': not args.quiet
+        'VERBOSE': not args.quiet,
+        'FAST_MODE': args.fast
     }
     
     # Update config with arguments
@@ -138,6 +158,153 @@ def configure_from_args(args) -> Config:
     return config
 
 
+def run_single_ga(job: Tuple[Dict[str, Any], Optional[int], int]) -> Dict[str, Any]:
+    """
+    Run the genetic algorithm once, without interaction or display.
+    
+    Args:
+        job: The configuration, the secret number (None for a random one) and the random seed
+        
+    Returns:
+        Dict[str, Any]: The run's statistics analysis
+    """
+    config, secret_number, seed = job
+    
+    # Each run has its own seed, so repeated runs are independent and reproducible
+    set_seed(seed)
+    if secret_number is None:
+        secret_number = rng.randint(config['MIN_NUMBER'], config['MAX_NUMBER'])
+    
+    tracker = StatisticsTracker()
+    tracker.start_tracking(config, secret_number)
+    
+    population = Population(config)
+    solution_found = False
+    for generation in range(1, config['MAX_GENERATIONS'] + 1):
+        solution_found = population.advance(secret_number)
+        
+        pop_stats = population.get_statistics()
+        tracker.record_generation_values(
+            generation,
+            pop_stats['best_guess'],
+            pop_stats['best_fitness'],
+            pop_stats['avg_fitness'],
+            population.get_value_diversity(),
+            len(population)
+        )
+        
+        if solution_found:
+            break
+    
+    tracker.end_tracking(success=solution_found, found_number=population.get_best_individual().value)
+    return tracker.analysis_results
+
+
+# Directory where the results of repeated runs are cached between invocations
+RUN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ga_guess')
+
+# Source files whose contents determine the result of a run
+GA_SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'genetic_algorithm')
+
+
+def _ga_source_digest() -> str:
+    """
+    Hash the genetic algorithm source files.
+    
+    The digest is part of every cache key, so cached runs are not replayed
+    after the algorithm changes.
+    
+    Returns:
+        str: Hex digest of the genetic algorithm sources
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for filename in sorted(os.listdir(GA_SOURCE_DIR)):
+        if filename.endswith('.py'):
+            digest.update(filename.encode())
+            with open(os.path.join(GA_SOURCE_DIR, filename), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _run_cache_path(job: Tuple[Dict[str, Any], Optional[int], int], source_digest: str) -> str:
+    """
+    Get the cache file for one run.
+    
+    A seeded run is fully determined by the algorithm's code, its
+    configuration, secret number and seed, so these make up the key.
+    
+    Args:
+        job: The configuration, the secret number (None for a random one) and the random seed
+        source_digest: Digest of the genetic algorithm sources
+        
+    Returns:
+        str: Path of the cache file for the run
+    """
+    config, secret_number, seed = job
+    key_data = json.dumps([source_digest, config, secret_number, seed], sort_keys=True).encode()
+    key = hashlib.blake2b(key_data, digest_size=16).hexdigest()
+    return os.path.join(RUN_CACHE_DIR, f"{key}.json")
+
+
+def run_repetitions(config: Dict[str, Any], secret_number: Optional[int], repetitions: int,
+                    jobs: int, first_seed: int = 0,
+                    use_cache: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Run the genetic algorithm several times, in parallel when more than one job is requested.
+    
+    With the cache enabled, results are kept on disk, so repeating an
+    identical experiment only runs the runs that are missing from the cache.
+    
+    Args:
+        config: The game configuration
+        secret_number: The secret number, or None to pick a random one for each run
+        repetitions: The number of runs
+        jobs: The number of worker processes
+        first_seed: The seed of the first run; the following runs use the next seeds
+        use_cache: Whether to reuse and store results in the on-disk cache
+        
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: The statistics analysis of each run,
+        in run order, and how many of them came from the cache
+    """
+    runs = [(config, secret_number, seed) for seed in range(first_seed, first_seed + repetitions)]
+    analyses: List[Optional[Dict[str, Any]]] = [None] * repetitions
+    
+    # Reuse the cached results of earlier identical runs
+    cache_paths = None
+    if use_cache:
+        source_digest = _ga_source_digest()
+        cache_paths = [_run_cache_path(run, source_digest) for run in runs]
+        for index, path in enumerate(cache_paths):
+            try:
+                with open(path, 'r') as f:
+                    analyses[index] = json.load(f)
+            except (OSError, ValueError):
+                pass
+    
+    missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+    missing_runs = [runs[index] for index in missing]
+    if jobs > 1 and len(missing_runs) > 1:
+        with Pool(jobs) as pool:
+            results = pool.map(run_single_ga, missing_runs)
+    else:
+        results = [run_single_ga(run) for run in missing_runs]
+    
+    for index, analysis in zip(missing, results):
+        analyses[index] = analysis
+        
+        # Store the new results; caching is best effort
+        if cache_paths is not None:
+            try:
+                os.makedirs(RUN_CACHE_DIR, exist_ok=True)
+                with open(cache_paths[index], 'w') as f:
+                    json.dump(analysis, f)
+            except (OSError, TypeError, ValueError):
+                pass
+    
+    return analyses, repetitions - len(missing)
+
+
 def main():
     """
     Main entry point for the application.
@@ -151,6 +318,24 @@ def main():
     # Create display
     display = Display(verbose=config.get('VERBOSE'), use_colors=config.get('USE_COLORS'))
     
+    # Repeated runs skip the interactive game and only report combined statistics
+    if args.repetitions > 1:
+        analyses, cached_runs = run_repetitions(config.as_dict(), args.secret, args.repetitions,
+                                                args.jobs, args.seed, args.cache)
+        summary = StatisticsTracker.aggregate_runs(analyses)
+        
+        display.show_message(f"Runs: {summary['runs']}", 'BOLD')
+        display.show_message(f"Successful: {summary['successes']} ({summary['success_rate']:.0%})")
+        display.show_message(f"Average generations: {summary['avg_generations']:.2f}")
+        if summary['avg_generations_successful'] is not None:
+            display.show_message(f"Average generations when successful: {summary['avg_generations_successful']:.2f}")
+        display.show_message(f"Average evaluations: {summary['avg_evaluations']:.1f}")
+        display.show_message(f"Average time: {summary['avg_time']:.4f} seconds")
+        if cached_runs:
+            display.show_message(f"{cached_runs} of {summary['runs']} runs were loaded from the cache, "
+                                 "with their original timings", 'YELLOW')
+        return
+    
     # Create statistics tracker
     stats_tracker = StatisticsTracker()
     
@@ -165,31 +350,30 @@ def main():
         secret_number = args.secret if args.secret is not None else game_manager.secret_number
         
         # Start tracking statistics
-        stats_tracker.start_tracking(config.as_dict(), secret_number)
+        stats_tracker.start_tracking(config.as_dict(copy=False), secret_number)
         
         # Initialize genetic algorithm components
-        population = Population(config.as_dict())
+        population = Population(config.as_dict(copy=False))
         
         # Patch the game manager with the population
         game_manager.population = population
         
         # Define a hook to record statistics after each generation
+        record_generation_values = stats_tracker.record_generation_values
+        
         def after_generation_hook():
             # Get population statistics
             pop_stats = population.get_statistics()
             
-            # Add some additional data
-            gen_data = {
-                'generation': game_manager.current_generation,
-                'best_guess': pop_stats['best_guess'],
-                'best_fitness': pop_stats['best_fitness'],
-                'avg_fitness': pop_stats['avg_fitness'],
-                'diversity': population.get_value_diversity(),
-                'population_size': len(population)
-            }
-            
-            # Record in the statistics tracker
-            stats_tracker.record_generation(gen_data)
+            # Record in the statistics tracker without building a per-generation dictionary
+            record_generation_values(
+                game_manager.current_generation,
+                pop_stats['best_guess'],
+                pop_stats['best_fitness'],
+                pop_stats['avg_fitness'],
+                population.get_value_diversity(),
+                len(population)
+            )
         
         # Patch the GameManager._run_generation method to use our GA components
         original_run_generation = game_manager._run_generation
@@ -203,13 +387,12 @@ def main():
             best_fitness = best_individual.fitness
             
             # Record this generation's results
-            generation_record = {
-                'generation': game_manager.current_generation,
-                'best_fitness': best_fitness,
-                'best_guess': best_individual.value,
-                'avg_fitness': population.get_average_fitness(),
-            }
-            game_manager.generation_history.append(generation_record)
+            record = game_manager.record_generation(
+                game_manager.current_generation,
+                best_fitness,
+                best_individual.value,
+                population.get_average_fitness()
+            )
             
             # Update best individual tracking
             game_manager.best_fitness = best_fitness
@@ -225,7 +408,7 @@ def main():
             # Call the after-generation hook
             after_generation_hook()
             
-            return solution_found
+            return solution_found, record
         
         # Replace the method
         game_manager._run_generation = patched_run_generation
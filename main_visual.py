@@ -66,6 +66,8 @@ def parse_arguments():
                        help='Save configuration to file')
     parser.add_argument('--save-stats', type=str, default=None,
                        help='Save statistics to file')
+    parser.add_argument('--fast', action='store_true',
+                       help='Skip interactive pauses (for batch runs)')
     
     # Visualization-specific arguments
     parser.add_argument('--visual-mode', type=str, default='all',
@@ -110,7 +112,8 @@ def configure_from_args(args):
         'MUTATION_METHOD': args.mutation,
         'FITNESS_METHOD': args.fitness,
         'USE_COLORS': True,
-        'VERBOSE': True
+        'VERBOSE': True,
+        'FAST_MODE': args.fast
     }
     
     # Add visualization settings
@@ -148,7 +151,7 @@ def main():
     stats_tracker = StatisticsTracker()
     
     # Create pygame visualizer
-    visualizer = PyGameVisualizer(config.as_dict())
+    visualizer = PyGameVisualizer(config.as_dict(copy=False))
     
     # Create game manager
     game_manager = GameManager(display, config.as_dict())
@@ -167,16 +170,16 @@ def main():
         secret_number = args.secret if args.secret is not None else game_manager.secret_number
         
         # Start tracking statistics
-        stats_tracker.start_tracking(config.as_dict(), secret_number)
+        stats_tracker.start_tracking(config.as_dict(copy=False), secret_number)
         
         # Initialize genetic algorithm components
-        population = Population(config.as_dict())
+        population = Population(config.as_dict(copy=False))
         
         # Patch the game manager with the population
         game_manager.population = population
         
         # Initialize visualizer with the population and secret number
-        visualizer.setup(population, secret_number, config.as_dict())
+        visualizer.setup(population, secret_number, config.as_dict(copy=False))
         
         # Define a hook to record statistics after each generation
         def after_generation_hook():
@@ -203,32 +206,33 @@ def main():
         original_run_generation = game_manager._run_generation
         
         def patched_run_generation():
-            # Before generation events
-            game_manager.notify_observers('before_generation', {
+            # Events are collected and sent to the observers in batches; each
+            # batch goes out before the population changes, so observers still
+            # see it in the state each event describes
+            events = [('before_generation', {
                 'generation': game_manager.current_generation,
                 'population': population
-            })
+            })]
             
             # Evaluate fitness
             population.evaluate_fitness(secret_number)
             
             # After fitness evaluation events
-            game_manager.notify_observers('after_fitness_evaluation', {
+            events.append(('after_fitness_evaluation', {
                 'population': population
-            })
+            }))
             
             # Get the best individual
             best_individual = population.get_best_individual()
             best_fitness = best_individual.fitness
             
             # Record this generation's results
-            generation_record = {
-                'generation': game_manager.current_generation,
-                'best_fitness': best_fitness,
-                'best_guess': best_individual.value,
-                'avg_fitness': population.get_average_fitness(),
-            }
-            game_manager.generation_history.append(generation_record)
+            record = game_manager.record_generation(
+                game_manager.current_generation,
+                best_fitness,
+                best_individual.value,
+                population.get_average_fitness()
+            )
             
             # Update best individual tracking
             game_manager.best_fitness = best_fitness
@@ -240,30 +244,32 @@ def main():
             # If not found, create the next generation
             if not solution_found:
                 # Before next generation creation
-                game_manager.notify_observers('before_next_generation', {
+                events.append(('before_next_generation', {
                     'population': population
-                })
+                }))
+                game_manager.notify_observers_batch(events)
                 
                 # Create next generation
                 population.create_next_generation()
                 
                 # After next generation creation
-                game_manager.notify_observers('after_next_generation', {
+                events = [('after_next_generation', {
                     'population': population
-                })
+                })]
             
             # Call the after-generation hook
             after_generation_hook()
             
             # After generation complete events
-            game_manager.notify_observers('after_generation', {
+            events.append(('after_generation', {
                 'generation': game_manager.current_generation,
                 'population': population,
                 'best_individual': best_individual,
                 'solution_found': solution_found
-            })
+            }))
+            game_manager.notify_observers_batch(events)
             
-            return solution_found
+            return solution_found, record
         
         # Replace the method
         game_manager._run_generation = patched_run_generation
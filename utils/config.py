@@ -7,7 +7,14 @@ settings, validation, and configuration file handling.
 
 import json
 import os
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List
+
+# orjson is optional; it reads and writes JSON faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Default configuration values
@@ -41,6 +48,8 @@ DEFAULT_CONFIG = {
     # Display parameters
     'VERBOSE': True,
     'USE_COLORS': True,
+    'FAST_MODE': False,  # Skip interactive pauses (useful for batch runs)
+    'SETUP_PAUSE': 2.0,  # Seconds to pause after showing the game setup
     
     # Advanced parameters
     'CONVERGENCE_THRESHOLD': 5,  # Number of generations with no improvement before considering converged
@@ -57,6 +66,33 @@ class Config:
     parameters for the game.
     """
     
+    # Numeric parameters as (key, minimum, maximum, type); None marks a bound
+    # that depends on another value and is filled in by validate
+    _RANGE_SPEC = (
+        ('MIN_NUMBER', 1, 1000000, int),
+        ('MAX_NUMBER', None, 1000000, int),  # At least MIN_NUMBER
+        ('MAX_GENERATIONS', 1, 100000, int),
+        ('DISPLAY_INTERVAL', 1, 1000, int),
+        ('POPULATION_SIZE', 2, 1000, int),
+        ('CROSSOVER_RATE', 0.0, 1.0, float),
+        ('MUTATION_RATE', 0.0, 1.0, float),
+        ('ELITISM_COUNT', 0, None, int),  # At most half the population
+        ('TOURNAMENT_SIZE', 2, 10, int),
+        ('SETUP_PAUSE', 0.0, 10.0, float),
+        ('CONVERGENCE_THRESHOLD', 1, 100, int),
+    )
+    
+    # Valid choices for the method parameters; invalid values fall back to the default
+    _ENUM_SPEC = {
+        'SELECTION_METHOD': frozenset(('tournament', 'roulette', 'rank')),
+        'CROSSOVER_METHOD': frozenset(('arithmetic', 'average', 'binary', 'binary_two_point', 'adaptive')),
+        'MUTATION_METHOD': frozenset(('random', 'bit_flip', 'boundary', 'gaussian', 'adaptive')),
+        'FITNESS_METHOD': frozenset(('linear', 'inverse', 'exponential', 'combined', 'hot_cold')),
+    }
+    
+    # Parameters that must be booleans
+    _BOOL_KEYS = ('VERBOSE', 'USE_COLORS', 'FAST_MODE', 'RESTART_ON_CONVERGENCE', 'ADAPTIVE_MUTATION')
+    
     def __init__(self, config_dict: Optional[Dict[str, Any]] = None):
         """
         Initialize the configuration with optional custom values.
@@ -67,6 +103,14 @@ class Config:
         # Start with default configuration
         self.config = DEFAULT_CONFIG.copy()
         
+        # Read-only view of the configuration, shared by as_dict(copy=False);
+        # once handed out, assignments are validated straight away
+        self._view = MappingProxyType(self.config)
+        self._view_shared = False
+        
+        # Set when a value has been assigned since the last validation
+        self._dirty = False
+        
         # Override with custom configuration if provided
         if config_dict:
             self.update(config_dict)
@@ -89,76 +133,44 @@ class Config:
         """
         Validate the configuration values and adjust if necessary.
         """
-        # Validate numeric ranges
-        self._validate_range('MIN_NUMBER', 1, 1000000)
-        self._validate_range('MAX_NUMBER', self.config['MIN_NUMBER'], 1000000)
-        self._validate_range('MAX_GENERATIONS', 1, 100000)
-        self._validate_range('DISPLAY_INTERVAL', 1, 1000)
-        
-        # Validate genetic algorithm parameters
-        self._validate_range('POPULATION_SIZE', 2, 1000)
-        self._validate_range('CROSSOVER_RATE', 0.0, 1.0)
-        self._validate_range('MUTATION_RATE', 0.0, 1.0)
-        self._validate_range('ELITISM_COUNT', 0, self.config['POPULATION_SIZE'] // 2)
-        
-        # Validate selection parameters
-        valid_selection_methods = ['tournament', 'roulette', 'rank']
-        if self.config['SELECTION_METHOD'] not in valid_selection_methods:
-            self.config['SELECTION_METHOD'] = 'tournament'
-        
-        self._validate_range('TOURNAMENT_SIZE', 2, 10)
+        self._dirty = False
+        config = self.config
+        default = DEFAULT_CONFIG
         
-        # Validate crossover parameters
-        valid_crossover_methods = ['arithmetic', 'average', 'binary', 'binary_two_point', 'adaptive']
-        if self.config['CROSSOVER_METHOD'] not in valid_crossover_methods:
-            self.config['CROSSOVER_METHOD'] = 'adaptive'
-        
-        # Validate mutation parameters
-        valid_mutation_methods = ['random', 'bit_flip', 'boundary', 'gaussian', 'adaptive']
-        if self.config['MUTATION_METHOD'] not in valid_mutation_methods:
-            self.config['MUTATION_METHOD'] = 'adaptive'
-        
-        # Validate fitness parameters
-        valid_fitness_methods = ['linear', 'inverse', 'exponential', 'combined', 'hot_cold']
-        if self.config['FITNESS_METHOD'] not in valid_fitness_methods:
-            self.config['FITNESS_METHOD'] = 'linear'
-        
-        # Validate boolean parameters
-        for key in ['VERBOSE', 'USE_COLORS', 'RESTART_ON_CONVERGENCE', 'ADAPTIVE_MUTATION']:
-            if not isinstance(self.config[key], bool):
-                self.config[key] = DEFAULT_CONFIG[key]
-        
-        # Calculate mutation range if not set
-        if self.config['MUTATION_RANGE'] is None:
-            value_range = self.config['MAX_NUMBER'] - self.config['MIN_NUMBER']
-            self.config['MUTATION_RANGE'] = max(1, value_range // 10)  # 10% of the range
-        
-        # Validate convergence parameters
-        self._validate_range('CONVERGENCE_THRESHOLD', 1, 100)
-    
-    def _validate_range(self, key: str, min_val: Any, max_val: Any) -> None:
-        """
-        Validate that a configuration value is within a specified range.
-        
-        Args:
-            key: The configuration key to validate
-            min_val: The minimum allowed value
-            max_val: The maximum allowed value
-        """
-        if key in self.config:
-            value = self.config[key]
+        # Validate numeric ranges, converting to the expected type if needed
+        for key, min_val, max_val, cast in self._RANGE_SPEC:
+            # Bounds that depend on other values
+            if key == 'MAX_NUMBER':
+                min_val = config['MIN_NUMBER']
+            elif key == 'ELITISM_COUNT':
+                max_val = config['POPULATION_SIZE'] // 2
+            
+            value = config[key]
             try:
-                # Convert to appropriate type if needed
-                if isinstance(min_val, int) and not isinstance(value, int):
-                    value = int(value)
-                elif isinstance(min_val, float) and not isinstance(value, float):
-                    value = float(value)
+                if not isinstance(value, cast):
+                    value = cast(value)
                 
                 # Enforce range
-                self.config[key] = max(min_val, min(value, max_val))
+                config[key] = min_val if value < min_val else max_val if value > max_val else value
             except (ValueError, TypeError):
                 # If conversion fails, use default value
-                self.config[key] = DEFAULT_CONFIG[key]
+                config[key] = default[key]
+        
+        # Validate method choices
+        for key, choices in self._ENUM_SPEC.items():
+            value = config[key]
+            if not isinstance(value, str) or value not in choices:
+                config[key] = default[key]
+        
+        # Validate boolean parameters
+        for key in self._BOOL_KEYS:
+            if not isinstance(config[key], bool):
+                config[key] = default[key]
+        
+        # Calculate mutation range if not set
+        if config['MUTATION_RANGE'] is None:
+            value_range = config['MAX_NUMBER'] - config['MIN_NUMBER']
+            config['MUTATION_RANGE'] = max(1, value_range // 10)  # 10% of the range
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -171,6 +183,8 @@ class Config:
         Returns:
             Any: The configuration value
         """
+        if self._dirty:
+            self.validate()
         return self.config.get(key, default)
     
     def save(self, filepath: str) -> bool:
@@ -183,9 +197,16 @@ class Config:
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._dirty:
+            self.validate()
+        
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(self.config, f, indent=4)
             return True
         except Exception:
             return False
@@ -203,8 +224,12 @@ class Config:
         """
         try:
             if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    config_dict = json.load(f)
+                if orjson is not None:
+                    with open(filepath, 'rb') as f:
+                        config_dict = orjson.loads(f.read())
+                else:
+                    with open(filepath, 'r') as f:
+                        config_dict = json.load(f)
                 return cls(config_dict)
         except Exception:
             pass
@@ -212,14 +237,23 @@ class Config:
         # Return default configuration if loading fails
         return cls()
     
-    def as_dict(self) -> Dict[str, Any]:
+    def as_dict(self, copy: bool = True) -> Mapping[str, Any]:
         """
         Get the configuration as a dictionary.
         
+        Args:
+            copy: Whether to return an independent copy. Otherwise a read-only
+                view is returned, which is cheaper and reflects later changes.
+        
         Returns:
-            Dict[str, Any]: The configuration dictionary
+            Mapping[str, Any]: The configuration dictionary, or a read-only view of it
         """
-        return self.config.copy()
+        if self._dirty:
+            self.validate()
+        if copy:
+            return self.config.copy()
+        self._view_shared = True
+        return self._view
     
     def __getitem__(self, key: str) -> Any:
         """
@@ -234,19 +268,29 @@ class Config:
         Raises:
             KeyError: If the key doesn't exist
         """
+        if self._dirty:
+            self.validate()
         return self.config[key]
     
     def __setitem__(self, key: str, value: Any) -> None:
         """
         Set a configuration value using dictionary-like syntax.
         
+        The configuration is validated on the next read rather than on every
+        assignment, so setting several values only validates once. Once a
+        read-only view has been handed out by as_dict, it is validated right
+        away, since reads through the view can't trigger the validation.
+        
         Args:
             key: The configuration key to set
             value: The value to set
         """
         if key in self.config:
             self.config[key] = value
-            self.validate()  # Re-validate to ensure consistency
+            if self._view_shared:
+                self.validate()
+            else:
+                self._dirty = True  # Re-validate on the next read to ensure consistency
     
     def __str__(self) -> str:
         """
@@ -262,10 +306,13 @@ class Config:
             "Crossover": ['CROSSOVER_METHOD'],
             "Mutation": ['MUTATION_METHOD'],
             "Fitness": ['FITNESS_METHOD'],
-            "Display": ['VERBOSE', 'USE_COLORS'],
+            "Display": ['VERBOSE', 'USE_COLORS', 'FAST_MODE', 'SETUP_PAUSE'],
             "Advanced": ['CONVERGENCE_THRESHOLD', 'RESTART_ON_CONVERGENCE', 'ADAPTIVE_MUTATION']
         }
         
+        if self._dirty:
+            self.validate()
+        
         result = "Configuration:\n"
         for section, keys in sections.items():
             result += f"\n{section}:\n"
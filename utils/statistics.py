@@ -42,6 +42,10 @@ class StatisticsTracker:
         # Generation history
         self.generation_history = []
         
+        # Generations recorded by record_generation_values, added to the
+        # generation history when it is next needed
+        self._pending_generations = []
+        
         # Convergence tracking
         self.best_fitness_history = []
         self.avg_fitness_history = []
@@ -65,6 +69,7 @@ class StatisticsTracker:
         self.generations = 0
         self.evaluations = 0
         self.generation_history = []
+        self._pending_generations = []
         self.best_fitness_history = []
         self.avg_fitness_history = []
         self.best_guess_history = []
@@ -84,6 +89,7 @@ class StatisticsTracker:
         self.total_time = self.end_time - self.start_time
         self.success = success
         self.found_number = found_number
+        self._flush_pending_generations()
         
         # Run analysis
         self._analyze_performance()
@@ -122,6 +128,59 @@ class StatisticsTracker:
         elif 'population_size' in self.config:
             self.evaluations += self.config['POPULATION_SIZE']
     
+    def record_generation_values(self, generation: int, best_guess: Any, best_fitness: float,
+                                 avg_fitness: float, diversity: float, population_size: int) -> None:
+        """
+        Record statistics for a single generation without building a dictionary.
+        
+        This is the per-generation fast path of record_generation: the values
+        go straight into the tracking histories, and the generation history
+        entry is only created when the history is next needed.
+        
+        Args:
+            generation: The generation number
+            best_guess: The value of the best individual
+            best_fitness: The fitness of the best individual
+            avg_fitness: The average fitness of the population
+            diversity: The value diversity of the population
+            population_size: The number of individuals evaluated
+        """
+        self.generations += 1
+        self._pending_generations.append(
+            (generation, best_guess, best_fitness, avg_fitness, diversity, population_size, time.time())
+        )
+        
+        # Update tracking histories
+        self.best_fitness_history.append(best_fitness)
+        self.avg_fitness_history.append(avg_fitness)
+        self.best_guess_history.append(best_guess)
+        self.diversity_history.append(diversity)
+        
+        # Update evaluations counter
+        self.evaluations += population_size
+    
+    def _flush_pending_generations(self) -> None:
+        """
+        Add the generations recorded by record_generation_values to the generation history.
+        """
+        if not self._pending_generations:
+            return
+        
+        self.generation_history.extend(
+            {
+                'generation': generation,
+                'best_guess': best_guess,
+                'best_fitness': best_fitness,
+                'avg_fitness': avg_fitness,
+                'diversity': diversity,
+                'population_size': population_size,
+                'timestamp': timestamp
+            }
+            for generation, best_guess, best_fitness, avg_fitness, diversity, population_size, timestamp
+            in self._pending_generations
+        )
+        self._pending_generations = []
+    
     def _analyze_performance(self) -> None:
         """
         Analyze the algorithm's performance.
@@ -233,6 +292,29 @@ class StatisticsTracker:
         
         return plateaus
     
+    @staticmethod
+    def aggregate_runs(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine the analysis results of several independent runs.
+        
+        Args:
+            analyses: The analysis_results of each run
+            
+        Returns:
+            Dict[str, Any]: Dictionary containing the combined statistics
+        """
+        successful = [analysis for analysis in analyses if analysis.get('success')]
+        
+        return {
+            'runs': len(analyses),
+            'successes': len(successful),
+            'success_rate': len(successful) / len(analyses) if analyses else 0.0,
+            'avg_generations': stats.mean(a['generations'] for a in analyses) if analyses else 0.0,
+            'avg_generations_successful': stats.mean(a['generations'] for a in successful) if successful else None,
+            'avg_evaluations': stats.mean(a['evaluations'] for a in analyses) if analyses else 0.0,
+            'avg_time': stats.mean(a['total_time'] for a in analyses) if analyses else 0.0,
+        }
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the statistics.
@@ -305,6 +387,8 @@ class StatisticsTracker:
         Returns:
             List[Dict[str, Any]]: List of generation data dictionaries
         """
+        self._flush_pending_generations()
+        
         if generation is None:
             return self.generation_history
         
@@ -323,6 +407,8 @@ class StatisticsTracker:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._flush_pending_generations()
+        
         try:
             data = {
                 'config': self.config,
@@ -9,7 +9,11 @@ import pygame
 from typing import Dict, Any, List, Tuple, Optional
 import math
 
-from .ui_components import draw_line_chart
+from .themes import get_font, render_text
+
+
+# Generations the x-axis holds before it is first rescaled
+MIN_PLOT_CAPACITY = 16
 
 
 class EvolutionChart:
@@ -41,7 +45,7 @@ class EvolutionChart:
         # Font for labels
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
         
         # Data storage
         self.best_fitness_data = []
@@ -51,6 +55,29 @@ class EvolutionChart:
         
         # Chart dimensions
         self.chart_height = (self.rect.height - 3 * self.padding - 30) // 2  # 30px for title
+        
+        # The plotted lines are kept on one cached surface per chart, and each
+        # new generation only adds its segment. The x-axis holds a fixed number
+        # of generations, doubled when full, so earlier points don't move and
+        # a full replot is only needed when the scale changes
+        self._plot_surfaces = None
+        self._plot_capacity = MIN_PLOT_CAPACITY
+        self._plotted_count = 0
+        
+        # Redraw flag, cleared by the visualizer once the panel is on screen
+        self.dirty = True
+        
+        # Copy of the last rendered panel, kept by the visualizer
+        self.cached_surface = None
+    
+    def get_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered by this component.
+        
+        Returns:
+            pygame.Rect: The component's rectangle on the screen
+        """
+        return self.rect
     
     def update_data(self, generation_data: List[Dict[str, Any]]) -> None:
         """
@@ -64,13 +91,27 @@ class EvolutionChart:
         self.avg_fitness_data = []
         self.diversity_data = []
         self.generation_numbers = []
+        self._plot_surfaces = None
         
         # Add data from each generation
         for gen_data in generation_data:
-            self.generation_numbers.append(gen_data.get('generation', 0))
-            self.best_fitness_data.append(gen_data.get('best_fitness', 0))
-            self.avg_fitness_data.append(gen_data.get('avg_fitness', 0))
-            self.diversity_data.append(gen_data.get('diversity', 0) * 100)  # Convert to percentage
+            self.add_data(gen_data)
+        
+        self.dirty = True
+    
+    def add_data(self, gen_data: Dict[str, Any]) -> None:
+        """
+        Append the data of a single new generation.
+        
+        Args:
+            gen_data: Generation data dictionary
+        """
+        self.generation_numbers.append(gen_data.get('generation', 0))
+        self.best_fitness_data.append(gen_data.get('best_fitness', 0))
+        self.avg_fitness_data.append(gen_data.get('avg_fitness', 0))
+        self.diversity_data.append(gen_data.get('diversity', 0) * 100)  # Convert to percentage
+        
+        self.dirty = True
     
     def reset(self) -> None:
         """Reset the chart data."""
@@ -78,6 +119,68 @@ class EvolutionChart:
         self.avg_fitness_data = []
         self.diversity_data = []
         self.generation_numbers = []
+        self._plot_surfaces = None
+        self.dirty = True
+    
+    def _update_plots(self, width: int, height: int) -> None:
+        """
+        Bring the cached line plots up to date with the data.
+        
+        Only the segments of generations added since the last update are
+        drawn, unless the x-axis has to be rescaled to fit them.
+        
+        Args:
+            width: Width of each chart
+            height: Height of each chart
+        """
+        count = len(self.generation_numbers)
+        
+        # Rescale when the x-axis is full; doubling keeps replots rare
+        rescale = self._plot_surfaces is None or self._plot_surfaces[0].get_size() != (width, height)
+        if count > self._plot_capacity:
+            while count > self._plot_capacity:
+                self._plot_capacity *= 2
+            rescale = True
+        
+        series = (
+            (0, self.best_fitness_data, self.theme.get('best_fitness_color', (0, 120, 0))),
+            (0, self.avg_fitness_data, self.theme.get('avg_fitness_color', (0, 80, 140))),
+            (1, self.diversity_data, self.theme.get('diversity_color', (160, 70, 120))),
+        )
+        
+        if rescale:
+            bg_color = self.theme.get('panel_color', (220, 220, 230))
+            border_color = self.theme.get('border_color', (180, 180, 190))
+            self._plot_surfaces = []
+            for _ in range(2):
+                plot = pygame.Surface((width, height))
+                plot.fill(bg_color)
+                pygame.draw.rect(plot, border_color, plot.get_rect(), 1)
+                self._plot_surfaces.append(plot)
+            self._plotted_count = 0
+        
+        start = self._plotted_count
+        if start >= count:
+            return
+        
+        x_step = width / (self._plot_capacity - 1)
+        point_radius = max(2, self.line_width)
+        for chart, data, color in series:
+            plot = self._plot_surfaces[chart]
+            previous = None
+            # Start one point back to join the new segments to the old line
+            for index in range(max(0, start - 1), count):
+                # Values are percentages (0-100), clamped to the chart
+                value = data[index]
+                normalized = 0.0 if value < 0 else 1.0 if value > 100 else value / 100
+                point = (index * x_step, height - normalized * height)
+                if previous is not None:
+                    pygame.draw.line(plot, color, previous, point, self.line_width)
+                    pygame.draw.circle(plot, color, previous, point_radius)
+                pygame.draw.circle(plot, color, point, point_radius)
+                previous = point
+        
+        self._plotted_count = count
     
     def render(self, surface) -> None:
         """
@@ -95,11 +198,11 @@ class EvolutionChart:
         pygame.draw.rect(surface, border_color, self.rect, 1, border_radius=5)
         
         # Draw title
-        title_font = pygame.font.SysFont(
+        title_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('title_font_size', 20)
         )
-        title_text = title_font.render("Evolution Progress", True,
+        title_text = render_text(title_font, "Evolution Progress",
                                       self.theme.get('text_color', (20, 20, 30)))
         title_rect = title_text.get_rect(midtop=(self.rect.centerx, self.rect.top + 5))
         surface.blit(title_text, title_rect)
@@ -120,39 +223,20 @@ class EvolutionChart:
         )
         
         # Draw fitness chart (top)
-        label_font = pygame.font.SysFont(
+        label_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('small_font_size', 12)
         )
         
-        fitness_label = label_font.render("Fitness", True, 
+        fitness_label = render_text(label_font, "Fitness", 
                                         self.theme.get('text_color', (20, 20, 30)))
         fitness_rect = fitness_label.get_rect(topleft=(top_chart_rect.left, top_chart_rect.top - 15))
         surface.blit(fitness_label, fitness_rect)
         
-        # Draw best fitness data
-        if self.best_fitness_data:
-            draw_line_chart(
-                surface,
-                top_chart_rect,
-                self.best_fitness_data,
-                self.theme.get('best_fitness_color', (0, 120, 0)),
-                0, 100,
-                self.line_width,
-                self.theme
-            )
-        
-        # Draw average fitness data
-        if self.avg_fitness_data:
-            draw_line_chart(
-                surface,
-                top_chart_rect,
-                self.avg_fitness_data,
-                self.theme.get('avg_fitness_color', (0, 80, 140)),
-                0, 100,
-                self.line_width,
-                self.theme
-            )
+        # Draw the best and average fitness lines from the cached plots
+        if self.generation_numbers:
+            self._update_plots(top_chart_rect.width, top_chart_rect.height)
+            surface.blit(self._plot_surfaces[0], top_chart_rect)
         
         # Draw fitness legend
         legend_y = top_chart_rect.top + 10
@@ -165,7 +249,7 @@ class EvolutionChart:
             (self.rect.right - 80, legend_y),
             self.line_width
         )
-        best_legend = label_font.render("Best Fitness", True,
+        best_legend = render_text(label_font, "Best Fitness",
                                        self.theme.get('text_color', (20, 20, 30)))
         surface.blit(best_legend, (self.rect.right - 75, legend_y - 5))
         
@@ -178,27 +262,19 @@ class EvolutionChart:
             (self.rect.right - 80, legend_y),
             self.line_width
         )
-        avg_legend = label_font.render("Avg Fitness", True,
+        avg_legend = render_text(label_font, "Avg Fitness",
                                       self.theme.get('text_color', (20, 20, 30)))
         surface.blit(avg_legend, (self.rect.right - 75, legend_y - 5))
         
         # Draw diversity chart (bottom)
-        diversity_label = label_font.render("Diversity %", True,
+        diversity_label = render_text(label_font, "Diversity %",
                                           self.theme.get('text_color', (20, 20, 30)))
         diversity_rect = diversity_label.get_rect(topleft=(bottom_chart_rect.left, bottom_chart_rect.top - 15))
         surface.blit(diversity_label, diversity_rect)
         
         # Draw diversity data
-        if self.diversity_data:
-            draw_line_chart(
-                surface,
-                bottom_chart_rect,
-                self.diversity_data,
-                self.theme.get('diversity_color', (160, 70, 120)),
-                0, 100,
-                self.line_width,
-                self.theme
-            )
+        if self.generation_numbers:
+            surface.blit(self._plot_surfaces[1], bottom_chart_rect)
         
         # Draw diversity legend
         legend_y = bottom_chart_rect.top + 10
@@ -209,7 +285,7 @@ class EvolutionChart:
             (self.rect.right - 80, legend_y),
             self.line_width
         )
-        div_legend = label_font.render("Diversity", True,
+        div_legend = render_text(label_font, "Diversity",
                                       self.theme.get('text_color', (20, 20, 30)))
         surface.blit(div_legend, (self.rect.right - 75, legend_y - 5))
         
@@ -252,7 +328,7 @@ class EvolutionChart:
             top_chart_rect: Rectangle for the top chart
             bottom_chart_rect: Rectangle for the bottom chart
         """
-        label_font = pygame.font.SysFont(
+        label_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('small_font_size', 12)
         )
@@ -265,10 +341,10 @@ class EvolutionChart:
             if start >= len(self.generation_numbers) or end >= len(self.generation_numbers):
                 continue
                 
-            # Calculate positions
+            # Calculate positions on the same x-axis as the plotted lines
             chart_width = top_chart_rect.width
-            start_x = top_chart_rect.left + (start / (len(self.generation_numbers) - 1)) * chart_width
-            end_x = top_chart_rect.left + (end / (len(self.generation_numbers) - 1)) * chart_width
+            start_x = top_chart_rect.left + (start / (self._plot_capacity - 1)) * chart_width
+            end_x = top_chart_rect.left + (end / (self._plot_capacity - 1)) * chart_width
             
             # Draw plateau indicators on both charts
             for chart_rect in [top_chart_rect, bottom_chart_rect]:
@@ -294,7 +370,7 @@ class EvolutionChart:
             # Add label for the longest plateau
             longest_plateau = max(plateaus, key=lambda p: p[1] - p[0])
             if start == longest_plateau[0] and end == longest_plateau[1]:
-                plateau_label = label_font.render("Plateau", True, (200, 0, 0))
+                plateau_label = render_text(label_font, "Plateau", (200, 0, 0))
                 label_rect = plateau_label.get_rect(midtop=(
                     (start_x + end_x) / 2,
                     top_chart_rect.top + 5
@@ -312,7 +388,7 @@ class EvolutionChart:
             first_low_div = min(low_diversity_gens)
             if first_low_div < len(self.generation_numbers):
                 # Mark the convergence point
-                x_pos = bottom_chart_rect.left + (first_low_div / (len(self.generation_numbers) - 1)) * bottom_chart_rect.width
+                x_pos = bottom_chart_rect.left + (first_low_div / (self._plot_capacity - 1)) * bottom_chart_rect.width
                 y_pos = bottom_chart_rect.centery
                 
                 # Draw marker
@@ -325,7 +401,7 @@ class EvolutionChart:
                 )
                 
                 # Add label
-                converge_label = label_font.render("Low Diversity", True,
+                converge_label = render_text(label_font, "Low Diversity",
                                                  self.theme.get('warning_color', (200, 150, 0)))
                 label_rect = converge_label.get_rect(midtop=(
                     x_pos,
@@ -10,7 +10,7 @@ from typing import Dict, Any, List, Tuple, Optional
 import math
 
 from genetic_algorithm.fitness import FitnessCalculator
-from .themes import get_fitness_color
+from .themes import get_fitness_color, get_font, render_text
 
 
 class FitnessLandscape:
@@ -42,8 +42,10 @@ class FitnessLandscape:
         self.fitness_method = fitness_method
         self.theme = theme or {}
         
-        # Fitness calculation method
-        self.fitness_func = self._get_fitness_function(fitness_method)
+        # Fitness calculation method, specialized for the value range
+        self.fitness_func = FitnessCalculator.specialize(
+            self._get_fitness_function(fitness_method), min_value, max_value
+        )
         
         # Visualization parameters
         self.padding = self.theme.get('padding', 10)
@@ -52,13 +54,32 @@ class FitnessLandscape:
         # Font for labels
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
         
         # Pre-calculate fitness landscape
         self.landscape_points = self._calculate_landscape()
         
         # Current population
         self.population = None
+        self.columns = None
+        
+        # Rendered static background, created on first render
+        self._background = None
+        
+        # Redraw flag, cleared by the visualizer once the panel is on screen
+        self.dirty = True
+        
+        # Copy of the last rendered panel, kept by the visualizer
+        self.cached_surface = None
+    
+    def get_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered by this component.
+        
+        Returns:
+            pygame.Rect: The component's rectangle on the screen
+        """
+        return self.rect
     
     def _get_fitness_function(self, method: str):
         """
@@ -70,16 +91,8 @@ class FitnessLandscape:
         Returns:
             function: The fitness calculation function
         """
-        # Map method names to FitnessCalculator methods
-        fitness_methods = {
-            'linear': FitnessCalculator.linear_distance,
-            'inverse': FitnessCalculator.inverse_distance,
-            'exponential': FitnessCalculator.exponential_decay,
-            'combined': FitnessCalculator.combined_fitness,
-            'hot_cold': lambda g, s, min_v, max_v: FitnessCalculator.hot_cold_guidance(g, s, min_v, max_v, None)
-        }
-        
-        return fitness_methods.get(method, FitnessCalculator.linear_distance)
+        # Use the same mapping as the population
+        return FitnessCalculator.get_fitness_function(method)
     
     def _calculate_landscape(self) -> List[Tuple[int, int]]:
         """
@@ -104,7 +117,7 @@ class FitnessLandscape:
             value = self.min_value + (i / (num_points - 1)) * value_range
             
             # Calculate fitness
-            fitness = self.fitness_func(value, self.secret_number, self.min_value, self.max_value)
+            fitness = self.fitness_func(value, self.secret_number)
             
             # Map to screen coordinates
             x = self.rect.left + self.padding + (i / (num_points - 1)) * content_width
@@ -122,6 +135,8 @@ class FitnessLandscape:
             population: The current Population object
         """
         self.population = population
+        self.columns = population.snapshot()
+        self.dirty = True
     
     def _value_to_x(self, value: int) -> int:
         """
@@ -168,6 +183,37 @@ class FitnessLandscape:
         if population and self.population != population:
             self.update_population(population)
         
+        # The axes, labels and curve never change, so they are drawn once and
+        # blitted back afterwards
+        if self._background is None:
+            self._draw_background(surface)
+            self._background = surface.subsurface(self.rect).copy()
+        else:
+            surface.blit(self._background, self.rect)
+        
+        # Draw population individuals on the landscape
+        if self.population:
+            best_fitness = max(self.columns['fitness'], default=None)
+            for value, fitness in zip(self.columns['values'], self.columns['fitness']):
+                x = self._value_to_x(value)
+                y = self._fitness_to_y(fitness)
+                
+                # Draw individual as circle with color based on fitness
+                color = get_fitness_color(self.theme, fitness)
+                pygame.draw.circle(surface, color, (x, y), 4)
+                
+                # For best individual, add highlight
+                if fitness == best_fitness:
+                    pygame.draw.circle(surface, self.theme.get('highlight_color', (70, 130, 180)),
+                                     (x, y), 6, 2)
+    
+    def _draw_background(self, surface) -> None:
+        """
+        Draw the static part of the view: panel, axes, labels, curve and target.
+        
+        Args:
+            surface: The pygame surface to render to
+        """
         # Background
         bg_color = self.theme.get('panel_color', (220, 220, 230))
         border_color = self.theme.get('border_color', (180, 180, 190))
@@ -177,7 +223,7 @@ class FitnessLandscape:
         pygame.draw.rect(surface, border_color, self.rect, 1, border_radius=5)
         
         # Draw title
-        title_font = pygame.font.SysFont(
+        title_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('title_font_size', 20)
         )
@@ -212,13 +258,13 @@ class FitnessLandscape:
         )
         
         # X-axis labels
-        label_font = pygame.font.SysFont(
+        label_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('small_font_size', 12)
         )
         
         # X-axis label
-        x_label = label_font.render("Value", True, 
+        x_label = render_text(label_font, "Value", 
                                    self.theme.get('text_color', (20, 20, 30)))
         x_label_rect = x_label.get_rect(midtop=(
             content_left + (content_right - content_left) // 2,
@@ -242,13 +288,13 @@ class FitnessLandscape:
             )
             
             # Draw value
-            value_label = label_font.render(str(int(tick_value)), True,
+            value_label = render_text(label_font, str(int(tick_value)),
                                           self.theme.get('text_color', (20, 20, 30)))
             value_rect = value_label.get_rect(midtop=(tick_x, content_bottom + 5))
             surface.blit(value_label, value_rect)
         
         # Y-axis label
-        y_label = label_font.render("Fitness", True,
+        y_label = render_text(label_font, "Fitness",
                                    self.theme.get('text_color', (20, 20, 30)))
         y_label_rect = y_label.get_rect(center=(
             content_left - 25,
@@ -277,7 +323,7 @@ class FitnessLandscape:
             )
             
             # Draw value
-            fitness_label = label_font.render(f"{tick_fitness:.0f}", True,
+            fitness_label = render_text(label_font, f"{tick_fitness:.0f}",
                                             self.theme.get('text_color', (20, 20, 30)))
             fitness_rect = fitness_label.get_rect(midright=(content_left - 7, tick_y))
             surface.blit(fitness_label, fitness_rect)
@@ -303,22 +349,7 @@ class FitnessLandscape:
         )
         
         # Secret number label
-        secret_label = label_font.render("Target", True,
+        secret_label = render_text(label_font, "Target",
                                        self.theme.get('secret_color', (70, 20, 170)))
         secret_rect = secret_label.get_rect(midbottom=(secret_x, content_top - 5))
         surface.blit(secret_label, secret_rect)
-        
-        # Draw population individuals on the landscape
-        if self.population:
-            for individual in self.population.individuals:
-                x = self._value_to_x(individual.value)
-                y = self._fitness_to_y(individual.fitness)
-                
-                # Draw individual as circle with color based on fitness
-                color = get_fitness_color(self.theme, individual.fitness)
-                pygame.draw.circle(surface, color, (x, y), 4)
-                
-                # For best individual, add highlight
-                if individual.fitness == self.population.get_best_individual().fitness:
-                    pygame.draw.circle(surface, self.theme.get('highlight_color', (70, 130, 180)),
-                                     (x, y), 6, 2)
\ No newline at end of file
@@ -10,7 +10,7 @@ from typing import Dict, Any, List, Tuple, Optional
 import math
 import random
 
-from .themes import get_fitness_color
+from .themes import get_fitness_color, get_font, render_text
 
 
 class OperationsView:
@@ -44,7 +44,7 @@ class OperationsView:
         # Font for labels
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
         
         # Operation state tracking
         self.current_population = None
@@ -58,6 +58,21 @@ class OperationsView:
         
         # Visualization layouts
         self._setup_layouts()
+        
+        # Redraw flag, cleared by the visualizer once the panel is on screen
+        self.dirty = True
+        
+        # Copy of the last rendered panel, kept by the visualizer
+        self.cached_surface = None
+    
+    def get_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered by this component.
+        
+        Returns:
+            pygame.Rect: The component's rectangle on the screen
+        """
+        return self.rect
     
     def _setup_layouts(self):
         """Set up the layout for different operation visualizations."""
@@ -99,6 +114,7 @@ class OperationsView:
         # Reset animation
         self.animation_phase = 'selection'
         self.animation_progress = 0.0
+        self.dirty = True
     
     def prepare_genetic_operations(self, population) -> None:
         """
@@ -116,6 +132,7 @@ class OperationsView:
             self.selected_parents = random.sample(population.individuals, num_parents)
             self.animation_phase = 'selection'
             self.animation_progress = 0.0
+            self.dirty = True
     
     def prepare_crossover(self) -> None:
         """Simulate crossover operations with selected parents."""
@@ -184,6 +201,7 @@ class OperationsView:
         """
         self.current_population = population
         self.animation_phase = 'none'
+        self.dirty = True
     
     def update_animation(self) -> None:
         """Update animation progress and transition between phases."""
@@ -226,11 +244,11 @@ class OperationsView:
         pygame.draw.rect(surface, border_color, self.rect, 1, border_radius=5)
         
         # Draw title
-        title_font = pygame.font.SysFont(
+        title_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('title_font_size', 20)
         )
-        title_text = title_font.render("Genetic Operations", True,
+        title_text = render_text(title_font, "Genetic Operations",
                                       self.theme.get('text_color', (20, 20, 30)))
         title_rect = title_text.get_rect(midtop=(self.rect.centerx, self.rect.top + 5))
         surface.blit(title_text, title_rect)
@@ -242,6 +260,10 @@ class OperationsView:
         
         # Update animation state
         self.update_animation()
+        
+        # Keep redrawing until the operation animations have finished
+        if self.animation_phase != 'none':
+            self.dirty = True
     
     def _draw_selection(self, surface) -> None:
         """
@@ -253,11 +275,11 @@ class OperationsView:
         section_rect = self.layouts['selection']
         
         # Section title
-        section_font = pygame.font.SysFont(
+        section_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('font_size', 16)
         )
-        section_text = section_font.render("Selection", True,
+        section_text = render_text(section_font, "Selection",
                                          self.theme.get('text_color', (20, 20, 30)))
         section_rect_text = section_text.get_rect(midtop=(section_rect.centerx, section_rect.top))
         surface.blit(section_text, section_rect_text)
@@ -292,11 +314,11 @@ class OperationsView:
         section_rect = self.layouts['crossover']
         
         # Section title
-        section_font = pygame.font.SysFont(
+        section_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('font_size', 16)
         )
-        section_text = section_font.render("Crossover", True,
+        section_text = render_text(section_font, "Crossover",
                                          self.theme.get('text_color', (20, 20, 30)))
         section_rect_text = section_text.get_rect(midtop=(section_rect.centerx, section_rect.top))
         surface.blit(section_text, section_rect_text)
@@ -386,11 +408,11 @@ class OperationsView:
         section_rect = self.layouts['mutation']
         
         # Section title
-        section_font = pygame.font.SysFont(
+        section_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('font_size', 16)
         )
-        section_text = section_font.render("Mutation", True,
+        section_text = render_text(section_font, "Mutation",
                                          self.theme.get('text_color', (20, 20, 30)))
         section_rect_text = section_text.get_rect(midtop=(section_rect.centerx, section_rect.top))
         surface.blit(section_text, section_rect_text)
@@ -483,7 +505,7 @@ class OperationsView:
                         diff_color = self.theme.get('success_color', (0, 150, 0)) if value_diff > 0 else \
                                   self.theme.get('error_color', (200, 0, 0))
                         
-                        diff_font = pygame.font.SysFont(
+                        diff_font = get_font(
                             self.theme.get('font_name', 'Arial'),
                             self.theme.get('small_font_size', 12)
                         )
@@ -532,7 +554,7 @@ class OperationsView:
             pygame.draw.circle(individual_surface, highlight_color, (radius, radius), radius, 2)
         
         # Draw value text
-        font = pygame.font.SysFont(
+        font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('small_font_size', 12)
         )
@@ -9,7 +9,7 @@ import pygame
 from typing import Dict, Any, List, Tuple, Optional
 import math
 
-from .themes import get_fitness_color
+from .themes import get_fitness_color, get_font
 
 
 class PopulationView:
@@ -45,16 +45,39 @@ class PopulationView:
         # Font for labels
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
         
         # Previous population state for animations
         self.prev_individuals = []
+        self.prev_positions = {}  # Value -> previous x-position
         self.animation_progress = 1.0  # 0.0-1.0, 1.0 means animation complete
         
+        # Rendered value labels (text and shadow), keyed by value
+        self._label_cache = {}
+        
         # Best individual tracking
         self.best_individual = None
         self.best_radius_factor = 1.0  # For pulsing animation
         self.pulse_direction = 0.05
+        
+        # Whether the best individual pulses. The pulse is animation only and
+        # keeps the view redrawing, so it is switched off when evolution stops
+        self.pulsing = True
+        
+        # Redraw flag, cleared by the visualizer once the panel is on screen
+        self.dirty = True
+        
+        # Copy of the last rendered panel, kept by the visualizer
+        self.cached_surface = None
+    
+    def get_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered by this component.
+        
+        Returns:
+            pygame.Rect: The component's rectangle on the screen
+        """
+        return self.rect
     
     def update_population(self, population) -> None:
         """
@@ -66,22 +89,54 @@ class PopulationView:
         # Store previous individuals for animation
         self.prev_individuals = self.current_individuals if hasattr(self, 'current_individuals') else []
         
-        # Store current population individuals
+        # Store current population individuals, with everything the renderer
+        # needs that doesn't change from frame to frame
+        columns = population.snapshot()
         self.current_individuals = [
             {
-                'value': ind.value,
-                'fitness': ind.fitness,
-                'position': self._calculate_position(ind.value)
+                'value': value,
+                'fitness': fitness,
+                'position': self._calculate_position(value),
+                'color': get_fitness_color(self.theme, fitness),
+                'radius': self.individual_radius * (1 + (fitness / 100) * 0.5 + 0.5)
             }
-            for ind in population.individuals
+            for value, fitness in zip(columns['values'], columns['fitness'])
         ]
         
         # Find the best individual
         self.best_individual = max(self.current_individuals, key=lambda ind: ind['fitness']) \
             if self.current_individuals else None
         
+        # Sort by fitness (low to high) so better individuals are drawn on top
+        self.current_individuals.sort(key=lambda ind: ind['fitness'])
+        
+        # The same value always maps to the same position
+        self.prev_positions = {ind['value']: ind['position'] for ind in self.prev_individuals}
+        
         # Reset animation
         self.animation_progress = 0.0
+        self.dirty = True
+    
+    def _get_value_label(self, value: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Get the rendered label for a value, rendering it on first use.
+        
+        Args:
+            value: The individual's value
+            
+        Returns:
+            Tuple[pygame.Surface, pygame.Surface]: The label text and its shadow
+        """
+        label = self._label_cache.get(value)
+        if label is None:
+            # Values change between generations, so keep the cache bounded
+            if len(self._label_cache) >= 256:
+                self._label_cache.clear()
+            text = str(value)
+            label = (self.font.render(text, True, (255, 255, 255)),
+                     self.font.render(text, True, (0, 0, 0)))
+            self._label_cache[value] = label
+        return label
     
     def _calculate_position(self, value: int) -> int:
         """
@@ -145,7 +200,7 @@ class PopulationView:
         pygame.draw.rect(surface, border_color, self.rect, 1, border_radius=5)
         
         # Draw title
-        title_font = pygame.font.SysFont(
+        title_font = get_font(
             self.theme.get('font_name', 'Arial'),
             self.theme.get('title_font_size', 20)
         )
@@ -207,90 +262,104 @@ class PopulationView:
         # Draw individuals
         if hasattr(self, 'current_individuals'):
             # Animation for best individual (pulsing)
-            if self.best_individual:
+            if self.best_individual and self.pulsing:
                 self.best_radius_factor += self.pulse_direction
                 if self.best_radius_factor > 1.5 or self.best_radius_factor < 1.0:
                     self.pulse_direction *= -1
             
-            # Sort by fitness (low to high) so better individuals are drawn on top
-            sorted_individuals = sorted(self.current_individuals, key=lambda x: x['fitness'])
+            animating = self.animation_progress < 1.0 and self.prev_positions
+            progress = self.animation_progress
+            best_value = self.best_individual['value'] if self.best_individual else None
+            highlight_color = self.theme.get('highlight_color', (70, 130, 180))
+            draw_circle = pygame.draw.circle
+            
+            # Value labels are collected and blitted in a single call at the end
+            label_blits = []
             
             # Draw each individual
-            for individual in sorted_individuals:
+            for individual in self.current_individuals:
                 # Calculate position with animation
-                if self.animation_progress < 1.0 and self.prev_individuals:
-                    # Find the same individual in the previous generation
-                    prev_individual = next(
-                        (p for p in self.prev_individuals if p['value'] == individual['value']),
-                        None
-                    )
+                if animating:
+                    prev_position = self.prev_positions.get(individual['value'])
                     
-                    # If found, animate movement
-                    if prev_individual:
-                        x_pos = prev_individual['position'] + (individual['position'] - prev_individual['position']) * self.animation_progress
+                    # If found in the previous generation, animate movement
+                    if prev_position is not None:
+                        x_pos = prev_position + (individual['position'] - prev_position) * progress
                     else:
                         # New individual, fade in from the edges
                         if individual['value'] < self.secret_number:
                             start_pos = self.rect.left
                         else:
                             start_pos = self.rect.right
-                        x_pos = start_pos + (individual['position'] - start_pos) * self.animation_progress
+                        x_pos = start_pos + (individual['position'] - start_pos) * progress
                 else:
                     x_pos = individual['position']
                 
-                # Determine size based on fitness
-                fitness_factor = (individual['fitness'] / 100) * 0.5 + 0.5  # Scale factor 0.5-1.0
-                radius = self.individual_radius * (1 + fitness_factor)
-                
                 # Special treatment for best individual
-                is_best = self.best_individual and individual['value'] == self.best_individual['value']
+                radius = individual['radius']
+                is_best = individual['value'] == best_value
                 if is_best:
                     radius *= self.best_radius_factor
                 
                 # Draw individual
                 y_pos = line_y - 20 - radius  # Position above the number line
-                color = get_fitness_color(self.theme, individual['fitness'])
                 
                 # Draw circle
-                pygame.draw.circle(surface, color, (x_pos, y_pos), radius)
+                draw_circle(surface, individual['color'], (x_pos, y_pos), radius)
                 
                 # For best individual, add outline
                 if is_best:
-                    pygame.draw.circle(surface, self.theme.get('highlight_color', (70, 130, 180)),
-                                     (x_pos, y_pos), radius, 2)
+                    draw_circle(surface, highlight_color, (x_pos, y_pos), radius, 2)
                 
                 # Add value label for the best individual or individuals with high fitness
                 if is_best or individual['fitness'] > 90:
-                    value_text = self.font.render(str(individual['value']), True, (255, 255, 255))
-                    value_rect = value_text.get_rect(center=(x_pos, y_pos))
+                    value_text, shadow_surface = self._get_value_label(individual['value'])
                     
                     # Draw shadow for better readability
-                    shadow_surface = self.font.render(str(individual['value']), True, (0, 0, 0))
-                    shadow_rect = shadow_surface.get_rect(center=(x_pos + 1, y_pos + 1))
-                    surface.blit(shadow_surface, shadow_rect)
-                    surface.blit(value_text, value_rect)
+                    label_blits.append((shadow_surface, shadow_surface.get_rect(center=(x_pos + 1, y_pos + 1))))
+                    label_blits.append((value_text, value_text.get_rect(center=(x_pos, y_pos))))
+            
+            surface.blits(label_blits, doreturn=False)
         
         # Draw population statistics
         if hasattr(population, 'get_statistics'):
             stats = population.get_statistics()
             
             # Prepare stats text
-            stats_font = pygame.font.SysFont(
+            stats_font = get_font(
                 self.theme.get('font_name', 'Arial'),
                 self.theme.get('small_font_size', 12)
             )
             
             stats_text = [
-                f"Population Size: {len(population.individuals)}",
+                f"Population Size: {len(population)}",
                 f"Unique Values: {stats.get('unique_values', 0)}",
                 f"Best Guess: {stats.get('best_guess', '?')}",
             ]
             
-            # Draw stats
+            # Draw stats in a single blit call
             y_offset = self.rect.bottom - 50
+            stats_blits = []
             for text in stats_text:
                 text_surface = stats_font.render(text, True, 
                                                self.theme.get('text_color', (20, 20, 30)))
                 text_rect = text_surface.get_rect(bottomright=(self.rect.right - 10, y_offset))
-                surface.blit(text_surface, text_rect)
-                y_offset += 15
\ No newline at end of file
+                stats_blits.append((text_surface, text_rect))
+                y_offset += 15
+            surface.blits(stats_blits, doreturn=False)
+        
+        # Keep redrawing while individuals move or the best one pulses
+        if self.animation_progress < 1.0 or (self.best_individual and self.pulsing):
+            self.dirty = True
+    
+    def set_pulsing(self, pulsing: bool) -> None:
+        """
+        Start or stop the pulsing of the best individual.
+        
+        Args:
+            pulsing: Whether the best individual should pulse
+        """
+        if pulsing and not self.pulsing:
+            # Redraw once to re-arm the animation
+            self.dirty = True
+        self.pulsing = pulsing
\ No newline at end of file
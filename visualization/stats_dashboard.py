@@ -10,6 +10,8 @@ from typing import Dict, Any, List, Tuple, Optional
 import time
 import math
 
+from .themes import get_font, render_text
+
 
 class StatsDashboard:
     """
@@ -58,11 +60,55 @@ class StatsDashboard:
         # Font for labels
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
-        self.small_font = pygame.font.SysFont(
+        self.font = get_font(font_name, font_size)
+        self.small_font = get_font(
             font_name,
             self.theme.get('small_font_size', 12)
         )
+        
+        # Redraw flag, cleared by the visualizer once the panel is on screen.
+        # The elapsed time keeps running between updates, so while the clock
+        # runs the panel is also redrawn when the displayed second changes
+        self._dirty = True
+        self._clock_refresh_at = 0.0
+        self.clock_running = True
+        
+        # Copy of the last rendered panel, kept by the visualizer
+        self.cached_surface = None
+    
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether the dashboard needs to be redrawn.
+        
+        Returns:
+            bool: True if the statistics changed or the clock is out of date
+        """
+        return self._dirty or (self.clock_running and time.time() >= self._clock_refresh_at)
+    
+    @dirty.setter
+    def dirty(self, value: bool) -> None:
+        self._dirty = value
+    
+    def set_clock_running(self, running: bool) -> None:
+        """
+        Start or stop refreshing the elapsed time.
+        
+        Args:
+            running: Whether the elapsed time should keep being redrawn
+        """
+        if running and not self.clock_running:
+            self._dirty = True
+        self.clock_running = running
+    
+    def get_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered by this component.
+        
+        Returns:
+            pygame.Rect: The component's rectangle on the screen
+        """
+        return self.rect
     
     def update_data(self, data: Dict[str, Any]) -> None:
         """
@@ -94,6 +140,8 @@ class StatsDashboard:
                     self.estimated_generations_to_solution = (100 - self.best_fitness) / progress_rate + self.generation
                 else:
                     self.estimated_generations_to_solution = self.generation
+        
+        self.dirty = True
     
     def reset(self) -> None:
         """Reset the dashboard statistics."""
@@ -108,6 +156,7 @@ class StatsDashboard:
         self.evaluations_per_second = 0.0
         self.generations_per_second = 0.0
         self.estimated_generations_to_solution = float('inf')
+        self.dirty = True
     
     def render(self, surface) -> None:
         """
@@ -143,7 +192,7 @@ class StatsDashboard:
         
         # Draw best fitness with progress bar
         best_fitness_label = "Best Fitness:"
-        label_surface = self.small_font.render(best_fitness_label, True, generation_color)
+        label_surface = render_text(self.small_font, best_fitness_label, generation_color)
         label_rect = label_surface.get_rect(topleft=(
             left_metrics_x,
             generation_rect.bottom + 8
@@ -218,7 +267,9 @@ class StatsDashboard:
         surface.blit(diversity_surface, diversity_rect)
         
         # Draw performance metrics on the right
-        elapsed_time = time.time() - self.start_time
+        now = time.time()
+        elapsed_time = now - self.start_time
+        self._clock_refresh_at = self.start_time + int(elapsed_time) + 1
         time_text = f"Time: {self._format_time(elapsed_time)}"
         time_surface = self.font.render(time_text, True, generation_color)
         time_rect = time_surface.get_rect(topleft=(
@@ -260,7 +311,7 @@ class StatsDashboard:
             str: Formatted time string
         """
         if seconds < 60:
-            return f"{seconds:.1f}s"
+            return f"{int(seconds)}s"
         elif seconds < 3600:
             minutes = int(seconds / 60)
             seconds = seconds % 60
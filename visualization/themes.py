@@ -6,6 +6,7 @@ for the visualization components.
 """
 
 import pygame
+from functools import lru_cache
 from typing import Dict, Any
 
 
@@ -216,6 +217,44 @@ def get_theme(theme_name: str = 'default') -> Dict[str, Any]:
     return THEMES.get(theme_name, DEFAULT_THEME)
 
 
+@lru_cache(maxsize=None)
+def get_font(font_name: str, size: int):
+    """
+    Get a font by name and size.
+    
+    Creating a font is slow, so each font is created once and shared by all
+    components.
+    
+    Args:
+        font_name: The name of the system font
+        size: The font size
+        
+    Returns:
+        pygame.font.Font: The font
+    """
+    return pygame.font.SysFont(font_name, size)
+
+
+@lru_cache(maxsize=512)
+def render_text(font, text: str, color):
+    """
+    Render antialiased text, reusing an earlier rendering of the same text.
+    
+    Rasterizing text is one of the most expensive parts of a redraw, and most
+    labels (titles, axis names, tick values) are the same every time. The
+    returned surface is shared, so callers must only blit it.
+    
+    Args:
+        font: The font to render with
+        text: The text to render
+        color: The text color (r, g, b), as a tuple
+        
+    Returns:
+        pygame.Surface: The rendered text
+    """
+    return font.render(text, True, color)
+
+
 def interpolate_color(color1, color2, factor: float):
     """
     Interpolate between two colors.
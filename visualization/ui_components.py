@@ -9,6 +9,8 @@ import pygame
 from typing import Callable, Optional, Tuple, Dict, Any
 import math
 
+from .themes import get_font
+
 
 class Button:
     """A clickable button UI component."""
@@ -36,7 +38,11 @@ class Button:
         # Set up font
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
+        
+        # Rendered label, redone only when the text changes
+        self._label_text = None
+        self._label_surface = None
     
     def handle_event(self, event, mouse_pos, mouse_buttons):
         """
@@ -78,10 +84,12 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=border_radius)
         
         # Button text
-        text_color = self.theme.get('button_text_color', (255, 255, 255))
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        if self.text != self._label_text:
+            text_color = self.theme.get('button_text_color', (255, 255, 255))
+            self._label_surface = self.font.render(self.text, True, text_color)
+            self._label_text = self.text
+        text_rect = self._label_surface.get_rect(center=self.rect.center)
+        surface.blit(self._label_surface, text_rect)
 
 
 class ToggleButton(Button):
@@ -161,6 +169,10 @@ class Slider:
         self.step = step
         self.dragging = False
         
+        # Rendered value text, redone only when the value changes
+        self._label_text = None
+        self._label_surface = None
+        
         # Calculate handle position
         self._update_handle_pos()
     
@@ -231,14 +243,15 @@ class Slider:
                          (self.handle_pos, self.rect.centery), handle_radius)
         
         # Value text
-        font_name = self.theme.get('font_name', 'Arial')
-        font_size = self.theme.get('small_font_size', 12)
-        font = pygame.font.SysFont(font_name, font_size)
-        
         value_text = str(int(self.value) if self.value == int(self.value) else f"{self.value:.1f}")
-        text_surface = font.render(value_text, True, self.theme.get('text_color', (20, 20, 30)))
-        text_rect = text_surface.get_rect(midtop=(self.handle_pos, self.rect.bottom - 15))
-        surface.blit(text_surface, text_rect)
+        if value_text != self._label_text:
+            font_name = self.theme.get('font_name', 'Arial')
+            font_size = self.theme.get('small_font_size', 12)
+            font = get_font(font_name, font_size)
+            self._label_surface = font.render(value_text, True, self.theme.get('text_color', (20, 20, 30)))
+            self._label_text = value_text
+        text_rect = self._label_surface.get_rect(midtop=(self.handle_pos, self.rect.bottom - 15))
+        surface.blit(self._label_surface, text_rect)
 
 
 class TextBox:
@@ -265,7 +278,11 @@ class TextBox:
         # Set up font
         font_name = self.theme.get('font_name', 'Arial')
         font_size = self.theme.get('font_size', 16)
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
+        
+        # Rendered text, redone only when the text changes
+        self._label_text = None
+        self._label_surface = None
     
     def render(self, surface):
         """
@@ -281,8 +298,11 @@ class TextBox:
             pygame.draw.rect(surface, bg_color, self.rect, border_radius=border_radius)
         
         # Text
-        text_color = self.theme.get('text_color', (20, 20, 30))
-        text_surface = self.font.render(self.text, True, text_color)
+        if self.text != self._label_text:
+            text_color = self.theme.get('text_color', (20, 20, 30))
+            self._label_surface = self.font.render(self.text, True, text_color)
+            self._label_text = self.text
+        text_surface = self._label_surface
         
         # Position based on alignment
         if self.align == 'left':